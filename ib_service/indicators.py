@@ -9,14 +9,25 @@ Author: TradingApp Development Team
 Version: 1.0.0
 """
 
+import os
+import threading
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Minimum number of requested indicators before the thread pool pays off;
+# below this the submit/result overhead outweighs any overlap
+PARALLEL_INDICATOR_THRESHOLD = 4
+
+# OHLCV tail kept per cached indicator state - covers the largest
+# indicator lookback (sma_50) so suffix recomputation stays exact
+INDICATOR_STATE_TAIL = 64
+
 class TechnicalIndicators:
     """
     Technical Analysis Indicators Calculator
@@ -237,62 +248,311 @@ class IndicatorCalculator:
     
     def __init__(self):
         self.indicators = TechnicalIndicators()
-    
+        # Shared pool for computing independent indicators in parallel;
+        # the underlying numpy kernels release the GIL on large arrays
+        self.executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix='indicators')
+        # Last-computed indicator state per (symbol, timeframe); lets a
+        # request that merely extends a cached range compute only the new
+        # suffix of bars instead of recomputing every indicator in full
+        self.state_cache: Dict[Tuple[str, str], Dict] = {}
+        self.state_lock = threading.Lock()
+
+    def compute_indicator(self, indicator: str, high: pd.Series, low: pd.Series,
+                          close: pd.Series, volume: pd.Series) -> Dict[str, pd.Series]:
+        """Calculate a single indicator, returning its output column(s)"""
+        if indicator == 'sma_20':
+            return {'sma_20': self.indicators.sma(close, 20)}
+        elif indicator == 'sma_50':
+            return {'sma_50': self.indicators.sma(close, 50)}
+        elif indicator == 'ema_12':
+            return {'ema_12': self.indicators.ema(close, 12)}
+        elif indicator == 'ema_26':
+            return {'ema_26': self.indicators.ema(close, 26)}
+        elif indicator == 'rsi':
+            return {'rsi': self.indicators.rsi(close)}
+        elif indicator == 'macd':
+            macd_data = self.indicators.macd(close)
+            return {
+                'macd': macd_data['macd'],
+                'macd_signal': macd_data['signal'],
+                'macd_histogram': macd_data['histogram']
+            }
+        elif indicator == 'bollinger':
+            bb_data = self.indicators.bollinger_bands(close)
+            return {
+                'bb_upper': bb_data['upper'],
+                'bb_middle': bb_data['middle'],
+                'bb_lower': bb_data['lower']
+            }
+        elif indicator == 'stochastic':
+            stoch_data = self.indicators.stochastic(high, low, close)
+            return {
+                'stoch_k': stoch_data['%K'],
+                'stoch_d': stoch_data['%D']
+            }
+        elif indicator == 'atr':
+            return {'atr': self.indicators.atr(high, low, close)}
+        elif indicator == 'obv':
+            return {'obv': self.indicators.obv(close, volume)}
+        elif indicator == 'vwap':
+            return {'vwap': self.indicators.vwap(high, low, close, volume)}
+        elif indicator == 'volume_sma':
+            return {'volume_sma': self.indicators.volume_sma(volume)}
+        else:
+            logger.warning(f"Unknown indicator requested: {indicator}")
+            return {}
+
+    def compute_indicator_columns(self, high: pd.Series, low: pd.Series, close: pd.Series,
+                                  volume: pd.Series, indicator_list: List[str]) -> Dict[str, pd.Series]:
+        """
+        Calculate specified indicators from OHLCV Series
+
+        Independent indicators are dispatched to the shared thread pool
+        when enough of them are requested to amortize the pool overhead.
+
+        Args:
+            high/low/close/volume: OHLCV data as Series
+            indicator_list: List of indicator names to calculate
+
+        Returns:
+            Dict mapping output column name to calculated Series
+        """
+        columns: Dict[str, pd.Series] = {}
+
+        if len(indicator_list) >= PARALLEL_INDICATOR_THRESHOLD:
+            futures = [
+                self.executor.submit(self.compute_indicator, indicator, high, low, close, volume)
+                for indicator in indicator_list
+            ]
+            for future in futures:
+                columns.update(future.result())
+        else:
+            for indicator in indicator_list:
+                columns.update(self.compute_indicator(indicator, high, low, close, volume))
+
+        return columns
+
     def calculate_indicators(self, df: pd.DataFrame, indicator_list: List[str]) -> pd.DataFrame:
         """
         Calculate specified indicators and add to DataFrame
-        
+
         Args:
             df: DataFrame with OHLCV data
             indicator_list: List of indicator names to calculate
-            
+
         Returns:
             DataFrame with original data + calculated indicators
         """
         result_df = df.copy()
-        
+
         try:
-            for indicator in indicator_list:
-                if indicator == 'sma_20':
-                    result_df['sma_20'] = self.indicators.sma(df['close'], 20)
-                elif indicator == 'sma_50':
-                    result_df['sma_50'] = self.indicators.sma(df['close'], 50)
-                elif indicator == 'ema_12':
-                    result_df['ema_12'] = self.indicators.ema(df['close'], 12)
-                elif indicator == 'ema_26':
-                    result_df['ema_26'] = self.indicators.ema(df['close'], 26)
-                elif indicator == 'rsi':
-                    result_df['rsi'] = self.indicators.rsi(df['close'])
-                elif indicator == 'macd':
-                    macd_data = self.indicators.macd(df['close'])
-                    result_df['macd'] = macd_data['macd']
-                    result_df['macd_signal'] = macd_data['signal']
-                    result_df['macd_histogram'] = macd_data['histogram']
-                elif indicator == 'bollinger':
-                    bb_data = self.indicators.bollinger_bands(df['close'])
-                    result_df['bb_upper'] = bb_data['upper']
-                    result_df['bb_middle'] = bb_data['middle']
-                    result_df['bb_lower'] = bb_data['lower']
-                elif indicator == 'stochastic':
-                    stoch_data = self.indicators.stochastic(df['high'], df['low'], df['close'])
-                    result_df['stoch_k'] = stoch_data['%K']
-                    result_df['stoch_d'] = stoch_data['%D']
-                elif indicator == 'atr':
-                    result_df['atr'] = self.indicators.atr(df['high'], df['low'], df['close'])
-                elif indicator == 'obv':
-                    result_df['obv'] = self.indicators.obv(df['close'], df['volume'])
-                elif indicator == 'vwap':
-                    result_df['vwap'] = self.indicators.vwap(df['high'], df['low'], df['close'], df['volume'])
-                elif indicator == 'volume_sma':
-                    result_df['volume_sma'] = self.indicators.volume_sma(df['volume'])
-                else:
-                    logger.warning(f"Unknown indicator requested: {indicator}")
-                    
+            columns = self.compute_indicator_columns(
+                df['high'], df['low'], df['close'], df['volume'], indicator_list)
+            for name, series in columns.items():
+                result_df[name] = series
+
         except Exception as e:
             logger.error(f"Error calculating indicators: {e}")
-            
+
         return result_df
-    
+
+    def calculate_indicators_arrays(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                                    volumes: np.ndarray, indicator_list: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Array-native variant of calculate_indicators
+
+        Wraps the OHLCV arrays in Series (no copy, no DataFrame allocation
+        or column inference) and returns only the calculated indicator
+        columns as numpy arrays.
+        """
+        try:
+            columns = self.compute_indicator_columns(
+                pd.Series(highs), pd.Series(lows), pd.Series(closes),
+                pd.Series(volumes), indicator_list)
+            return {name: series.to_numpy() for name, series in columns.items()}
+
+        except Exception as e:
+            logger.error(f"Error calculating indicators: {e}")
+            return {}
+
+    @staticmethod
+    def _ema_continue(prev: float, values: np.ndarray, period: int) -> np.ndarray:
+        """Continue an adjust=False EMA recurrence from its last value"""
+        alpha = 2.0 / (period + 1.0)
+        out = np.empty(len(values))
+        for i, x in enumerate(values):
+            prev += alpha * (x - prev)
+            out[i] = prev
+        return out
+
+    @staticmethod
+    def _ohlcv_tails(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                     volumes: np.ndarray) -> Dict[str, np.ndarray]:
+        """Trailing OHLCV slices kept with cached state for suffix recomputation"""
+        return {
+            'high': highs[-INDICATOR_STATE_TAIL:],
+            'low': lows[-INDICATOR_STATE_TAIL:],
+            'close': closes[-INDICATOR_STATE_TAIL:],
+            'volume': volumes[-INDICATOR_STATE_TAIL:],
+        }
+
+    def _store_indicator_state(self, key: Tuple[str, str], requested: Tuple[str, ...],
+                               timestamps: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                               closes: np.ndarray, volumes: np.ndarray,
+                               columns: Dict[str, np.ndarray]) -> None:
+        """Cache fully computed columns plus the state needed to extend them"""
+        aux: Dict[str, float] = {}
+        if 'ema_12' in columns:
+            aux['ema_12'] = float(columns['ema_12'][-1])
+        if 'ema_26' in columns:
+            aux['ema_26'] = float(columns['ema_26'][-1])
+        if 'macd' in columns:
+            close_series = pd.Series(closes)
+            aux['macd_ema_fast'] = float(self.indicators.ema(close_series, 12).iloc[-1])
+            aux['macd_ema_slow'] = float(self.indicators.ema(close_series, 26).iloc[-1])
+            aux['macd_signal'] = float(columns['macd_signal'][-1])
+        if 'obv' in columns:
+            aux['obv'] = float(columns['obv'][-1])
+        if 'vwap' in columns:
+            typical = (highs + lows + closes) / 3
+            aux['vwap_num'] = float(np.sum(typical * volumes))
+            aux['vwap_den'] = float(np.sum(volumes))
+        entry = {
+            'indicators': requested,
+            'timestamps': timestamps,
+            'columns': columns,
+            'tails': self._ohlcv_tails(highs, lows, closes, volumes),
+            'aux': aux,
+        }
+        with self.state_lock:
+            self.state_cache[key] = entry
+
+    def _extend_indicator_columns(self, entry: Dict, highs: np.ndarray, lows: np.ndarray,
+                                  closes: np.ndarray, volumes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute indicator values for bars appended after a cached range
+
+        Windowed indicators are recomputed over tail + suffix (exact, the
+        tail covers every lookback); EMA-family indicators continue their
+        recurrences and cumulative indicators their running sums from the
+        cached state. Updates entry['aux'] in place.
+        """
+        m = entry['timestamps'].size
+        tails = entry['tails']
+        aux = entry['aux']
+        ind = self.indicators
+        suffix = slice(m, None)
+        seg_high = pd.Series(np.concatenate([tails['high'], highs[suffix]]))
+        seg_low = pd.Series(np.concatenate([tails['low'], lows[suffix]]))
+        seg_close = pd.Series(np.concatenate([tails['close'], closes[suffix]]))
+        seg_volume = pd.Series(np.concatenate([tails['volume'], volumes[suffix]]))
+        k = len(closes) - m
+
+        out: Dict[str, np.ndarray] = {}
+        for indicator in entry['indicators']:
+            if indicator == 'sma_20':
+                out['sma_20'] = ind.sma(seg_close, 20).to_numpy()[-k:]
+            elif indicator == 'sma_50':
+                out['sma_50'] = ind.sma(seg_close, 50).to_numpy()[-k:]
+            elif indicator == 'ema_12':
+                out['ema_12'] = self._ema_continue(aux['ema_12'], closes[suffix], 12)
+                aux['ema_12'] = float(out['ema_12'][-1])
+            elif indicator == 'ema_26':
+                out['ema_26'] = self._ema_continue(aux['ema_26'], closes[suffix], 26)
+                aux['ema_26'] = float(out['ema_26'][-1])
+            elif indicator == 'rsi':
+                out['rsi'] = ind.rsi(seg_close).to_numpy()[-k:]
+            elif indicator == 'macd':
+                fast = self._ema_continue(aux['macd_ema_fast'], closes[suffix], 12)
+                slow = self._ema_continue(aux['macd_ema_slow'], closes[suffix], 26)
+                macd_line = fast - slow
+                signal = self._ema_continue(aux['macd_signal'], macd_line, 9)
+                out['macd'] = macd_line
+                out['macd_signal'] = signal
+                out['macd_histogram'] = macd_line - signal
+                aux['macd_ema_fast'] = float(fast[-1])
+                aux['macd_ema_slow'] = float(slow[-1])
+                aux['macd_signal'] = float(signal[-1])
+            elif indicator == 'bollinger':
+                bb_data = ind.bollinger_bands(seg_close)
+                out['bb_upper'] = bb_data['upper'].to_numpy()[-k:]
+                out['bb_middle'] = bb_data['middle'].to_numpy()[-k:]
+                out['bb_lower'] = bb_data['lower'].to_numpy()[-k:]
+            elif indicator == 'stochastic':
+                stoch_data = ind.stochastic(seg_high, seg_low, seg_close)
+                out['stoch_k'] = stoch_data['%K'].to_numpy()[-k:]
+                out['stoch_d'] = stoch_data['%D'].to_numpy()[-k:]
+            elif indicator == 'atr':
+                out['atr'] = ind.atr(seg_high, seg_low, seg_close).to_numpy()[-k:]
+            elif indicator == 'obv':
+                direction = np.sign(np.diff(closes[m - 1:]))
+                out['obv'] = aux['obv'] + np.cumsum(direction * volumes[suffix])
+                aux['obv'] = float(out['obv'][-1])
+            elif indicator == 'vwap':
+                typical = (highs[suffix] + lows[suffix] + closes[suffix]) / 3
+                num = aux['vwap_num'] + np.cumsum(typical * volumes[suffix])
+                den = aux['vwap_den'] + np.cumsum(volumes[suffix])
+                out['vwap'] = num / den
+                aux['vwap_num'] = float(num[-1])
+                aux['vwap_den'] = float(den[-1])
+            elif indicator == 'volume_sma':
+                out['volume_sma'] = ind.volume_sma(seg_volume).to_numpy()[-k:]
+        return out
+
+    def calculate_indicators_incremental(self, symbol: str, timeframe: str, timestamps: np.ndarray,
+                                         highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                                         volumes: np.ndarray,
+                                         indicator_list: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Calculate indicators, reusing cached per-(symbol, timeframe) state
+
+        When the requested range merely extends the previously computed
+        range for the same symbol, timeframe and indicator set, only the
+        new suffix of bars is computed and spliced onto the cached
+        columns. Any miss falls back to a full array calculation.
+        """
+        # Indicator math runs in float32: ~7 significant digits is ample
+        # for derived overlays and it halves memory traffic on long
+        # histories. Callers keep their float64 price arrays for the
+        # response payload, so no representation noise reaches the wire
+        highs = np.asarray(highs, dtype=np.float32)
+        lows = np.asarray(lows, dtype=np.float32)
+        closes = np.asarray(closes, dtype=np.float32)
+
+        requested = tuple(indicator_list)
+        key = (symbol.upper(), timeframe)
+        with self.state_lock:
+            entry = self.state_cache.get(key)
+
+        if entry is not None and entry['indicators'] == requested:
+            m = entry['timestamps'].size
+            if 0 < m <= timestamps.size and np.array_equal(timestamps[:m], entry['timestamps']):
+                if m == timestamps.size:
+                    return entry['columns']
+                try:
+                    suffix_cols = self._extend_indicator_columns(entry, highs, lows, closes, volumes)
+                    columns = {name: np.concatenate([entry['columns'][name], arr])
+                               for name, arr in suffix_cols.items()}
+                    new_entry = {
+                        'indicators': requested,
+                        'timestamps': timestamps,
+                        'columns': columns,
+                        'tails': self._ohlcv_tails(highs, lows, closes, volumes),
+                        'aux': entry['aux'],
+                    }
+                    with self.state_lock:
+                        self.state_cache[key] = new_entry
+                    return columns
+                except Exception as e:
+                    logger.warning(f"Incremental indicator update failed, recomputing in full: {e}")
+
+        columns = self.calculate_indicators_arrays(highs, lows, closes, volumes, indicator_list)
+        if columns and timestamps.size:
+            self._store_indicator_state(key, requested, timestamps, highs, lows,
+                                        closes, volumes, columns)
+        return columns
+
     def get_available_indicators(self) -> Dict[str, Dict]:
         """Return list of available indicators with metadata"""
         return {
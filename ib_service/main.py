@@ -9,20 +9,29 @@ import asyncio
 import math
 import threading
 import calendar
+import itertools
+import queue
+import re
+import hashlib
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
-from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from operator import attrgetter
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from ibapi.client import EClient
 from ibapi.wrapper import EWrapper
 from ibapi.contract import Contract
-from ibapi.order import Order
 from ibapi.common import *
 from ibapi.ticktype import *
-import uvicorn
+import orjson
+import random
 
 # Technical indicators support
 import pandas as pd
@@ -47,13 +56,37 @@ if not IB_HOST:
 IB_PORT = int(os.getenv('IB_PORT', '4002'))
 IB_CLIENT_ID = int(os.getenv('IB_CLIENT_ID', '1'))
 IB_TIMEOUT = int(os.getenv('IB_TIMEOUT', '15'))
+# Extra IB client sessions used for contract searches, on top of the
+# primary persistent connection. Each session needs its own clientId
+# slot at the gateway, so keep this small
+IB_POOL_SIZE = int(os.getenv('IB_POOL_SIZE', '2'))
 CORS_ORIGINS = os.getenv('IB_CORS_ORIGINS', '').split(',') if os.getenv('IB_CORS_ORIGINS') else []
 
+# Date parsing constants shared by the bar-processing paths
+UTC = timezone.utc
+IB_DATETIME_FORMAT = "%Y%m%d %H:%M:%S"
+IB_DATE_FORMAT = "%Y%m%d"
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string for response timestamps
+
+    Aware UTC skips the local-time lookup that naive datetime.now() does
+    on every call, and gives clients an unambiguous offset to parse.
+    """
+    return datetime.now(UTC).isoformat()
+
 # Trading account configuration
 DEFAULT_ACCOUNT_MODE = os.getenv('DEFAULT_ACCOUNT_MODE', 'paper')  # 'paper' or 'live'
 
 # Global IB connection
 ib_client = None
+# Serializes the (re)connect ladder so concurrent requests that hit a
+# transient disconnect don't all run the multi-client-ID retry at once
+connection_lock = threading.Lock()
+# Status is published by rebinding the whole dict to a fresh one rather
+# than mutating keys in place: readers on the event loop always see a
+# complete snapshot (the rebind is one pointer swap under the GIL),
+# never a half-updated state between key assignments
 connection_status = {
     'connected': False,
     'last_connected': None,
@@ -73,6 +106,72 @@ symbol_cache = {}
 cache_ttl = 3600  # 1 hour cache TTL
 max_cache_size = 10000  # Maximum cache entries
 
+# Qualified contract cache - contracts change rarely, so repeat requests
+# skip the reqContractDetails round-trip entirely
+contract_cache = {}
+contract_cache_ttl = 86400  # 24 hour TTL
+
+# Encoded /market-data/history response cache. Closed bars are immutable,
+# so a hit skips the IB round-trip, indicator compute and serialization;
+# entries expire around the next bar close for their timeframe
+history_cache = {}
+history_cache_max_size = 256
+
+# Long-lived market-data subscriptions keyed by (symbol, account_mode).
+# The front-end polls the realtime endpoint every couple of seconds, so
+# instead of a subscribe/wait/cancel cycle per poll the subscription is
+# kept open and repeat polls read the latest tick snapshot immediately.
+# reqIds start at 100 to stay clear of the fixed ids the other request
+# paths use; a reconnect drops the subscriptions server-side and the
+# empty snapshot triggers a fresh reqMktData on the same id
+realtime_subscriptions: Dict[tuple, int] = {}
+realtime_req_ids = itertools.count(100)
+
+# In-flight history fetches keyed by the full history cache key, so
+# concurrent identical requests await one IB round-trip instead of
+# issuing duplicates (same single-flight scheme as the account endpoints)
+history_fetch_inflight: Dict[tuple, "asyncio.Task"] = {}
+
+# Bar length per timeframe, used to derive the history cache TTL
+timeframe_seconds = {
+    '1min': 60,
+    '5min': 300,
+    '15min': 900,
+    '30min': 1800,
+    '1hour': 3600,
+    '4hour': 14400,
+    '8hour': 28800,
+    '1day': 86400
+}
+
+# Contract search result cache - contract metadata is essentially static
+# within a trading day, and the UI re-issues the same searches on every
+# keystroke. TTL is jittered so a burst of entries doesn't expire (and
+# re-hit IB Gateway) all at once
+contract_search_cache = {}
+contract_search_cache_ttl = 21600  # 6 hours
+contract_search_cache_jitter = 600
+contract_search_cache_max_size = 512
+
+def get_cached_search(key):
+    """Return a cached search response, or None if absent/expired"""
+    entry = contract_search_cache.get(key)
+    if entry and time.time() < entry[0]:
+        return entry[1]
+    return None
+
+def cache_search_result(key, response) -> None:
+    """Store a search response with a jittered expiry time"""
+    if len(contract_search_cache) >= contract_search_cache_max_size:
+        contract_search_cache.pop(next(iter(contract_search_cache)))
+    expires_at = time.time() + contract_search_cache_ttl + random.randint(0, contract_search_cache_jitter)
+    contract_search_cache[key] = (expires_at, response)
+
+def history_cache_ttl(timeframe: str) -> int:
+    """TTL for a cached history response - roughly one bar, clamped so
+    intraday entries refresh quickly and daily entries within the hour"""
+    return min(max(timeframe_seconds.get(timeframe, 3600), 60), 3600)
+
 class MarketDataRequest(BaseModel):
     symbol: str = Field(..., min_length=1, max_length=10)
     timeframe: str = Field(..., pattern=r'^(tick|1min|5min|15min|30min|1hour|4hour|8hour|1day)$')
@@ -128,6 +227,9 @@ class SearchRequest(BaseModel):
     currency: str = "USD"
     name: bool = False
     account_mode: str = "paper"
+    include_description: bool = False  # symbol+companyName already cover it for most UIs
+    limit: int = Field(default=50, ge=1, le=500)
+    cursor: Optional[str] = None  # conid of the last row of the previous page
 
 class AdvancedSearchRequest(BaseModel):
     symbol: str = ""
@@ -141,6 +243,9 @@ class AdvancedSearchRequest(BaseModel):
     includeExpired: bool = False
     name: bool = False
     account_mode: str = "paper"
+    include_description: bool = False  # symbol+companyName already cover it for most UIs
+    limit: int = Field(default=50, ge=1, le=500)
+    cursor: Optional[str] = None  # conid of the last row of the previous page
 
 class SymbolDiscoveryRequest(BaseModel):
     pattern: str  # Search pattern (partial symbol)
@@ -205,49 +310,87 @@ class IBApp(EWrapper, EClient):
         EClient.__init__(self, self)
         self.data = {}
         self.contracts = []
-        self.historical_data = []
+        # Historical bars partitioned by reqId so concurrent requests over
+        # the same connection don't interleave their results
+        self.historical_data: Dict[int, List] = {}
+        # Completion events (armed per reqId by the requesting thread, set
+        # from the API callback thread) so waiters wake as soon as data
+        # arrives instead of sleep-polling
+        self.historical_data_events: Dict[int, threading.Event] = {}
+        self.contract_details_events: Dict[int, threading.Event] = {}
+        self.account_summary_events: Dict[int, threading.Event] = {}
+        self.market_data_events: Dict[int, threading.Event] = {}
+        # Account-level completion events (these callbacks carry no reqId)
+        self.position_end_event: Optional[threading.Event] = None
+        self.open_order_end_event: Optional[threading.Event] = None
+        self.managed_accounts_event: Optional[threading.Event] = None
+        self.current_time_event: Optional[threading.Event] = None
+        self.server_time = None
         self.account_summary = {}
         self.positions = []
         self.orders = []
         self.managed_accounts = []
         self.next_order_id = None
         self.connection_ready = threading.Event()
+        # monotonic timestamp of the last passing health check, so
+        # bursts of calls can skip re-verifying
+        self.last_healthy_at = 0.0
+        # Connection liveness as a plain attribute: set once the
+        # connection is verified, cleared by connectionClosed, so
+        # per-request guards read a bool instead of walking to the
+        # socket via isConnected()
+        self.alive = False
         
     def error(self, reqId, errorCode, errorString):
         """Handle TWS API errors"""
-        logger.error(f"TWS API Error {errorCode}: {errorString} (reqId: {reqId})")
+        logger.error("TWS API Error %s: %s (reqId: %s)", errorCode, errorString, reqId)
         
     def connectAck(self):
         """Called when connection is acknowledged"""
         logger.info("TWS API connection acknowledged")
+
+    def connectionClosed(self):
+        """Called when the gateway drops the connection"""
+        logger.warning("TWS API connection closed by gateway")
+        self.alive = False
+        self.last_healthy_at = 0.0
         
     def nextValidId(self, orderId):
         """Called when next valid order ID is received"""
         self.next_order_id = orderId
-        logger.info(f"Next valid order ID: {orderId}")
+        logger.info("Next valid order ID: %s", orderId)
         
     def managedAccounts(self, accountsList):
         """Called when managed accounts are received"""
         self.managed_accounts = accountsList.split(',')
-        logger.info(f"Managed accounts: {self.managed_accounts}")
+        logger.info("Managed accounts: %s", self.managed_accounts)
+        event = self.managed_accounts_event
+        if event:
+            event.set()
         
     def contractDetails(self, reqId, contractDetails):
         """Called when contract details are received"""
         self.contracts.append(contractDetails.contract)
-        logger.info(f"Contract details received for reqId {reqId}: {contractDetails.contract.symbol}")
+        logger.info("Contract details received for reqId %s: %s", reqId, contractDetails.contract.symbol)
         
     def contractDetailsEnd(self, reqId):
         """Called when contract details request is complete"""
-        logger.info(f"Contract details request completed for reqId {reqId}")
+        logger.info("Contract details request completed for reqId %s", reqId)
+        event = self.contract_details_events.get(reqId)
+        if event:
+            event.set()
         
     def historicalData(self, reqId, bar):
         """Called when historical data is received"""
-        self.historical_data.append(bar)
-        logger.debug(f"Historical data received for reqId {reqId}: {bar}")
+        self.historical_data.setdefault(reqId, []).append(bar)
+        logger.debug("Historical data received for reqId %s: %s", reqId, bar)
         
     def historicalDataEnd(self, reqId, start, end):
         """Called when historical data request is complete"""
-        logger.info(f"Historical data request completed for reqId {reqId}")
+        logger.info("Historical data request completed for reqId %s", reqId)
+        event = self.historical_data_events.get(reqId)
+        if event:
+            event.set()
         
     def tickPrice(self, reqId, tickType, price, attrib):
         """Called when tick price is received"""
@@ -255,7 +398,10 @@ class IBApp(EWrapper, EClient):
             self.data[reqId] = {}
         self.data[reqId]['price'] = price
         self.data[reqId]['tickType'] = tickType
-        logger.debug(f"Tick price for reqId {reqId}: {tickType} = {price}")
+        logger.debug("Tick price for reqId %s: %s = %s", reqId, tickType, price)
+        event = self.market_data_events.get(reqId)
+        if event:
+            event.set()
         
     def tickSize(self, reqId, tickType, size):
         """Called when tick size is received"""
@@ -263,18 +409,21 @@ class IBApp(EWrapper, EClient):
             self.data[reqId] = {}
         self.data[reqId]['size'] = size
         self.data[reqId]['tickType'] = tickType
-        logger.debug(f"Tick size for reqId {reqId}: {tickType} = {size}")
+        logger.debug("Tick size for reqId %s: %s = %s", reqId, tickType, size)
         
     def accountSummary(self, reqId, account, tag, value, currency):
         """Called when account summary is received"""
         if account not in self.account_summary:
             self.account_summary[account] = {}
         self.account_summary[account][tag] = value
-        logger.debug(f"Account summary for {account}: {tag} = {value}")
+        logger.debug("Account summary for %s: %s = %s", account, tag, value)
         
     def accountSummaryEnd(self, reqId):
         """Called when account summary request is complete"""
-        logger.info(f"Account summary request completed for reqId {reqId}")
+        logger.info("Account summary request completed for reqId %s", reqId)
+        event = self.account_summary_events.get(reqId)
+        if event:
+            event.set()
         
     def position(self, account, contract, position, avgCost):
         """Called when position is received"""
@@ -284,11 +433,14 @@ class IBApp(EWrapper, EClient):
             'position': position,
             'avgCost': avgCost
         })
-        logger.debug(f"Position received: {contract.symbol} = {position}")
+        logger.debug("Position received: %s = %s", contract.symbol, position)
         
     def positionEnd(self):
         """Called when position request is complete"""
         logger.info("Position request completed")
+        event = self.position_end_event
+        if event:
+            event.set()
         
     def openOrder(self, orderId, contract, order, orderState):
         """Called when open order is received"""
@@ -298,21 +450,83 @@ class IBApp(EWrapper, EClient):
             'order': order,
             'orderState': orderState
         })
-        logger.debug(f"Open order received: {orderId} - {contract.symbol}")
-        
+        logger.debug("Open order received: %s - %s", orderId, contract.symbol)
+
+    def openOrderEnd(self):
+        """Called when open order request is complete"""
+        logger.info("Open order request completed")
+        event = self.open_order_end_event
+        if event:
+            event.set()
+
     def orderStatus(self, orderId, status, filled, remaining, avgFillPrice, permId, parentId, lastFillPrice, clientId, whyHeld, mktCapPrice):
         """Called when order status is updated"""
-        logger.debug(f"Order status: {orderId} - {status}")
+        logger.debug("Order status: %s - %s", orderId, status)
+
+    def currentTime(self, time_):
+        """Called with the gateway clock in response to reqCurrentTime"""
+        self.server_time = time_
+        event = self.current_time_event
+        if event:
+            event.set()
 
 def get_ib_connection():
-    """Get or create IB connection with intelligent client ID retry"""
-    global ib_client, connection_status
-    
-    try:
-        # Check if we have a valid connection
+    """Get the long-lived IB connection, reconnecting only if it was lost"""
+    global ib_client
+
+    # Fast path: liveness is a plain attribute kept current by the
+    # connectionClosed callback, so no socket walk and no locking
+    if ib_client and ib_client.alive:
+        return ib_client
+
+    # Slow path: only one thread runs the retry ladder; the others wait
+    # here and pick up the connection it established
+    with connection_lock:
         if ib_client and ib_client.isConnected():
             return ib_client
-        
+        return establish_ib_connection()
+
+def attempt_ib_connection(client_id):
+    """Connect and verify a single candidate client ID (blocking)
+
+    Polls for the connection instead of a fixed settle sleep - a
+    healthy gateway is ready in well under a second, and a dead one
+    fails in 10s instead of 20s. Raises on failure with the client
+    already disconnected.
+    """
+    app = IBApp()
+    try:
+        logger.info("Attempting connection to IB Gateway at %s:%s (Client ID: %s)", IB_HOST, IB_PORT, client_id)
+        app.connect(IB_HOST, IB_PORT, client_id)
+
+        # Start the message processing thread
+        api_thread = threading.Thread(target=app.run, daemon=True)
+        api_thread.start()
+
+        verify_deadline = time.monotonic() + 10
+        while time.monotonic() < verify_deadline:
+            if app.isConnected():
+                app.alive = True
+                logger.info("✅ Connection verified (Client ID: %s)", client_id)
+                return app
+            if app.conn is None:
+                # connect() tore the socket down already - no point
+                # polling out the rest of the window
+                raise Exception(f"Could not connect to IB Gateway at {IB_HOST}:{IB_PORT}")
+            time.sleep(0.5)
+        raise Exception("Connection call succeeded but connection verification failed after retries")
+    except Exception:
+        try:
+            app.disconnect()
+        except:
+            pass
+        raise
+
+def establish_ib_connection():
+    """Create a new IB connection with intelligent client ID retry (caller must hold connection_lock)"""
+    global ib_client, connection_status
+
+    try:
         # Clean up any existing connection first
         if ib_client:
             try:
@@ -321,88 +535,53 @@ def get_ib_connection():
             except:
                 pass
             ib_client = None
-        
-        # Try multiple client IDs if the primary one is in use
-        import random
+
         base_id = IB_CLIENT_ID
-        client_ids_to_try = [base_id, base_id + 1, base_id + 2, base_id + 3, base_id + 4, base_id + 5]
-        random.shuffle(client_ids_to_try[1:])
         last_error = None
-        
-        for client_id in client_ids_to_try:
-            try:
-                logger.info(f"Attempting connection to IB Gateway at {IB_HOST}:{IB_PORT} (Client ID: {client_id})")
-                ib_client = IBApp()
-                
-                # Connect to TWS API
-                ib_client.connect(IB_HOST, IB_PORT, client_id)
-                
-                # Start the message processing thread
-                api_thread = threading.Thread(target=ib_client.run, daemon=True)
-                api_thread.start()
-                
-                # Wait for connection to be established
-                logger.info("Waiting for connection to stabilize...")
-                time.sleep(5)
-                
-                # Verify connection
-                connection_verified = False
-                for verify_attempt in range(5):
-                    if ib_client.isConnected():
-                        connection_verified = True
-                        logger.info(f"✅ Connection verified on attempt {verify_attempt + 1}")
-                        break
+
+        # The primary ID is almost always free, so try it alone first
+        # and leave the gateway undisturbed in the common case
+        try:
+            ib_client = attempt_ib_connection(base_id)
+        except Exception as e:
+            last_error = str(e)
+            logger.warning("⚠️  Client ID %s failed (%s), fanning out fallback IDs...", base_id, last_error)
+
+        if ib_client is None:
+            # Fan out the fallback IDs concurrently and adopt the first
+            # verified client: worst-case connect latency is one
+            # verification window, not five in sequence
+            fallback_ids = [base_id + i for i in range(1, 6)]
+            with ThreadPoolExecutor(max_workers=len(fallback_ids), thread_name_prefix='ib-connect') as connect_pool:
+                futures = [connect_pool.submit(attempt_ib_connection, cid) for cid in fallback_ids]
+                for future in as_completed(futures):
+                    try:
+                        app = future.result()
+                    except Exception as e:
+                        last_error = str(e)
+                        continue
+                    if ib_client is None:
+                        ib_client = app
                     else:
-                        logger.warning(f"Connection verification attempt {verify_attempt + 1}/5 - not yet connected, waiting...")
-                        time.sleep(3)
-                
-                if connection_verified:
-                    connection_status.update({
-                        'connected': True,
-                        'last_connected': datetime.now().isoformat(),
-                        'last_error': None,
-                        'connection_count': connection_status['connection_count'] + 1
-                    })
-                    logger.info(f"✅ Successfully connected and verified IB Gateway at {IB_HOST}:{IB_PORT} (Client ID: {client_id})")
-                    return ib_client
-                else:
-                    raise Exception("Connection call succeeded but connection verification failed after retries")
-                    
-            except Exception as e:
-                error_msg = str(e)
-                last_error = error_msg
-                
-                if "client id is already in use" in error_msg.lower() or "326" in error_msg:
-                    logger.warning(f"⚠️  Client ID {client_id} is already in use, trying next ID...")
-                    if ib_client:
-                        try:
-                            ib_client.disconnect()
-                        except:
-                            pass
-                        ib_client = None
-                    continue
-                elif "peer closed" in error_msg.lower() or "connection established but" in error_msg.lower():
-                    logger.warning(f"⚠️  Connection issue with Client ID {client_id}: {error_msg}. Trying next ID...")
-                    if ib_client:
-                        try:
-                            ib_client.disconnect()
-                        except:
-                            pass
-                        ib_client = None
-                    time.sleep(2)
-                    continue
-                else:
-                    logger.error(f"Connection error with Client ID {client_id}: {error_msg}")
-                    if ib_client:
+                        # A winner is already adopted - give the extra
+                        # clientId slot back to the gateway
                         try:
-                            ib_client.disconnect()
+                            app.disconnect()
                         except:
                             pass
-                        ib_client = None
-                    break
-        
+
+        if ib_client is not None:
+            connection_status = {
+                'connected': True,
+                'last_connected': _now_iso(),
+                'last_error': None,
+                'connection_count': connection_status['connection_count'] + 1
+            }
+            logger.info("✅ Successfully connected and verified IB Gateway at %s:%s (Client ID: %s)", IB_HOST, IB_PORT, ib_client.clientId)
+            return ib_client
+
         # If we get here, all client IDs failed
-        logger.error(f"❌ Failed to connect with any client ID. Last error: {last_error}")
+        logger.error("❌ Failed to connect with any client ID. Last error: %s", last_error)
         
         # Provide helpful error message based on error type
         if "timeout" in str(last_error).lower():
@@ -416,10 +595,7 @@ def get_ib_connection():
         else:
             helpful_msg = f"IB Gateway connection failed: {last_error}"
         
-        connection_status.update({
-            'connected': False,
-            'last_error': helpful_msg
-        })
+        connection_status = {**connection_status, 'connected': False, 'last_error': helpful_msg}
         
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -432,10 +608,7 @@ def get_ib_connection():
         error_msg = f"Unexpected connection error: {str(e)}"
         logger.error(error_msg)
         
-        connection_status.update({
-            'connected': False,
-            'last_error': error_msg
-        })
+        connection_status = {**connection_status, 'connected': False, 'last_error': error_msg}
         
         if ib_client:
             try:
@@ -450,23 +623,37 @@ def get_ib_connection():
         )
 
 def verify_connection_health(ib_client):
-    """Verify that an IB connection is healthy and responsive"""
+    """Verify that an IB connection is healthy and responsive
+
+    A passing check is remembered for 2s, so request bursts that hit
+    several sync paths back-to-back (e.g. /account/all) verify once
+    instead of per path.
+    """
     try:
-        if not ib_client or not ib_client.isConnected():
+        if not ib_client:
             return False
-        
+
+        if time.monotonic() - ib_client.last_healthy_at < 2.0:
+            return True
+
+        if not ib_client.isConnected():
+            return False
+
+        ib_client.last_healthy_at = time.monotonic()
         logger.debug("Connection health check passed - basic state verified")
         return True
-            
+
     except Exception as e:
-        logger.warning(f"Connection health check failed: {e}")
+        logger.warning("Connection health check failed: %s", e)
         return False
 
 def disconnect_ib():
     """Disconnect from IB Gateway with improved cleanup"""
     global ib_client, connection_status
-    
-    if ib_client:
+
+    with connection_lock:
+        if not ib_client:
+            return
         try:
             if ib_client.isConnected():
                 logger.info("Disconnecting from IB Gateway...")
@@ -475,15 +662,144 @@ def disconnect_ib():
             else:
                 logger.info("IB Gateway already disconnected")
         except Exception as e:
-            logger.error(f"Error during disconnection: {e}")
+            logger.error("Error during disconnection: %s", e)
         finally:
             ib_client = None
-            connection_status.update({
-                'connected': False,
-                'last_error': None
-            })
+            connection_status = {**connection_status, 'connected': False, 'last_error': None}
             logger.info("Connection cleanup completed")
 
+class IBClientPool:
+    """Small pool of extra IB client sessions for contract searches
+
+    Each pooled client connects with its own clientId and owns
+    independent wrapper state, so overlapping searches don't share one
+    ``contracts`` list or queue behind whatever the primary connection
+    is doing. Clients are created lazily on first checkout and reused;
+    a client found dead at checkout is reconnected in place.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect_client(self, slot: int):
+        """Connect a pool client for the given slot (blocking)"""
+        # Each slot gets a clientId range clear of the primary
+        # connection's retry ladder (IB_CLIENT_ID .. IB_CLIENT_ID+5)
+        base_id = IB_CLIENT_ID + 10 * (slot + 1)
+        last_error = None
+        for client_id in range(base_id, base_id + 3):
+            app = IBApp()
+            try:
+                logger.info("Connecting pool client %s to %s:%s (Client ID: %s)", slot, IB_HOST, IB_PORT, client_id)
+                app.connect(IB_HOST, IB_PORT, client_id)
+                threading.Thread(target=app.run, daemon=True).start()
+                for _ in range(10):
+                    if app.isConnected():
+                        logger.info("✅ Pool client %s connected (Client ID: %s)", slot, client_id)
+                        app.alive = True
+                        app.pool_slot = slot
+                        return app
+                    time.sleep(0.5)
+                raise Exception("connection verification timed out")
+            except Exception as e:
+                last_error = e
+                try:
+                    app.disconnect()
+                except:
+                    pass
+        raise Exception(f"Failed to connect pool client {slot}: {last_error}")
+
+    @contextmanager
+    def acquire(self, timeout: float = 10):
+        """Check out a connected client, returning it to the pool on exit"""
+        ib = self._checkout(timeout)
+        try:
+            yield ib
+        finally:
+            ib.last_released_at = time.monotonic()
+            self._idle.put(ib)
+
+    def _checkout(self, timeout: float):
+        slot = None
+        with self._lock:
+            if self._idle.empty() and self._created < self.size:
+                slot = self._created
+                self._created += 1
+        if slot is not None:
+            # Grow the pool outside the lock so a slow gateway handshake
+            # doesn't stall other checkouts
+            try:
+                return self._connect_client(slot)
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            ib = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="All IB search clients are busy - try again shortly"
+            )
+        if not ib.alive:
+            logger.warning("Pool client %s lost its connection, reconnecting", ib.pool_slot)
+            try:
+                ib.disconnect()
+            except:
+                pass
+            try:
+                ib = self._connect_client(ib.pool_slot)
+            except Exception:
+                # Give the slot back like the lazy-create path does, so a
+                # failed reconnect doesn't shrink the pool permanently -
+                # the next checkout recreates the client
+                with self._lock:
+                    self._created -= 1
+                raise
+        return ib
+
+    def evict_idle(self, max_idle: float = 600):
+        """Disconnect clients idle longer than max_idle seconds
+
+        Frees their gateway clientId slots between search bursts; the
+        slots are recreated lazily on the next checkout.
+        """
+        keep = []
+        while True:
+            try:
+                ib = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - getattr(ib, 'last_released_at', 0) > max_idle:
+                logger.info("Evicting idle pool client %s", ib.pool_slot)
+                try:
+                    ib.disconnect()
+                except Exception as e:
+                    logger.error("Error disconnecting pool client: %s", e)
+                with self._lock:
+                    self._created -= 1
+            else:
+                keep.append(ib)
+        for ib in keep:
+            self._idle.put(ib)
+
+    def disconnect_all(self):
+        """Disconnect every idle client (shutdown cleanup)"""
+        while True:
+            try:
+                ib = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                ib.disconnect()
+            except Exception as e:
+                logger.error("Error disconnecting pool client: %s", e)
+
+ib_pool = IBClientPool(IB_POOL_SIZE)
+
 # Cache utility functions
 def get_cache_key(pattern: str, secType: str, exchange: str, currency: str) -> str:
     """Generate cache key for symbol search"""
@@ -500,12 +816,12 @@ def get_cached_symbols(cache_key: str) -> Optional[List[Dict]]:
     if cache_key in symbol_cache:
         cache_entry = symbol_cache[cache_key]
         if is_cache_valid(cache_entry):
-            logger.info(f"Cache hit for {cache_key}")
+            logger.info("Cache hit for %s", cache_key)
             return cache_entry['data']
         else:
             # Remove expired entry
             del symbol_cache[cache_key]
-            logger.info(f"Cache expired for {cache_key}")
+            logger.info("Cache expired for %s", cache_key)
     return None
 
 def cache_symbols(cache_key: str, data: List[Dict]) -> None:
@@ -521,7 +837,7 @@ def cache_symbols(cache_key: str, data: List[Dict]) -> None:
         'data': data,
         'timestamp': time.time()
     }
-    logger.info(f"Cached {len(data)} symbols for {cache_key}")
+    logger.info("Cached %s symbols for %s", len(data), cache_key)
 
 def create_contract(symbol: str, sec_type: str = 'STK', exchange: str = 'SMART', currency: str = 'USD'):
     """Create IB contract using TWS API"""
@@ -532,6 +848,44 @@ def create_contract(symbol: str, sec_type: str = 'STK', exchange: str = 'SMART',
     contract.currency = currency
     return contract
 
+@lru_cache(maxsize=256)
+def cached_contract(symbol: str, sec_type: str = 'STK', exchange: str = 'SMART', currency: str = 'USD'):
+    """Memoized request-template contract for the hot market-data paths
+
+    Only for call sites that pass the contract straight into a TWS
+    request unchanged - paths that set extra fields (advanced search)
+    must keep building fresh instances via create_contract, or they
+    would corrupt the shared cached object.
+    """
+    return create_contract(symbol, sec_type, exchange, currency)
+
+def wait_tws_event(event: threading.Event, timeout: float, name: str) -> bool:
+    """Wait for a TWS completion event, warning once on timeout
+
+    Shared by every wait site so timeout handling and logging stay
+    uniform; returns True when the callback fired in time.
+    """
+    if not event.wait(timeout=timeout):
+        logger.warning("Timed out waiting for %s", name)
+        return False
+    return True
+
+def request_contract_details(ib, req_id: int, contract, timeout: float = 5) -> None:
+    """Issue reqContractDetails and block until contractDetailsEnd fires
+
+    Wakes as soon as the completion callback arrives instead of sleeping
+    a fixed interval; on timeout falls through with whatever contracts
+    have been collected so far.
+    """
+    done = threading.Event()
+    ib.contract_details_events[req_id] = done
+    try:
+        ib.reqContractDetails(req_id, contract)
+        wait_tws_event(done, timeout, f"contract details (reqId {req_id})")
+    finally:
+        ib.contract_details_events.pop(req_id, None)
+
+@lru_cache(maxsize=None)
 def get_data_type_for_account_mode(account_mode: str = 'paper') -> str:
     """Determine data type based on account mode"""
     if account_mode.lower() == 'live':
@@ -539,6 +893,7 @@ def get_data_type_for_account_mode(account_mode: str = 'paper') -> str:
     else:
         return 'delayed'  # Default to delayed for paper trading
 
+@lru_cache(maxsize=None)
 def get_market_data_source(account_mode: str = 'paper') -> str:
     """Get market data source description based on account mode"""
     if account_mode.lower() == 'live':
@@ -546,6 +901,7 @@ def get_market_data_source(account_mode: str = 'paper') -> str:
     else:
         return 'Paper Trading Data (Delayed 15-20 min)'
 
+@lru_cache(maxsize=None)
 def convert_timeframe(timeframe: str) -> str:
     """Convert timeframe to IB format"""
     timeframe_map = {
@@ -561,6 +917,7 @@ def convert_timeframe(timeframe: str) -> str:
     }
     return timeframe_map.get(timeframe, '1 hour')
 
+@lru_cache(maxsize=None)
 def convert_period(period: str) -> str:
     """Convert period to IB format (integer{SPACE}unit)"""
     period_map = {
@@ -573,97 +930,137 @@ def convert_period(period: str) -> str:
     }
     return period_map.get(period, '1 Y')
 
+def process_bars_str_space(bars) -> List[Dict]:
+    """Specialized conversion for the dominant "YYYYMMDD HH:MM:SS" string format
+
+    No isinstance ladder and no per-bar try/except - callers dispatch here
+    only after checking the first bar's shape, and fall back to the generic
+    path if a mixed batch makes this loop raise. Emits the same plain
+    dicts (CandlestickBar shape) as candlesticks_from_arrays so every
+    path feeds orjson directly.
+    """
+    strptime = datetime.strptime
+    timegm = calendar.timegm
+    return [
+        {
+            'timestamp': timegm(strptime(' '.join(bar.date.split()), IB_DATETIME_FORMAT).timetuple()),
+            'open': float(bar.open),
+            'high': float(bar.high),
+            'low': float(bar.low),
+            'close': float(bar.close),
+            'volume': int(bar.volume)
+        }
+        for bar in bars
+    ]
+
 def process_bars(bars, symbol: str, timeframe: str, period: str) -> HistoricalDataResponse:
     """Process IB bars into candlestick data with simple timestamp handling"""
     candlesticks = []
-    
-    for bar in bars:
+
+    # Dispatch once on the shape of the first bar: almost all production
+    # traffic is "YYYYMMDD HH:MM:SS" strings, so take the specialized loop
+    # and only pay the per-bar format ladder below for unusual batches
+    if bars and isinstance(bars[0].date, str) and ' ' in bars[0].date:
         try:
-            # Robust timestamp parsing for IB Gateway string format
-            if isinstance(bar.date, str):
-                # Clean and normalize the date string
-                date_str = bar.date.strip()
+            candlesticks = process_bars_str_space(bars)
+        except (ValueError, TypeError) as e:
+            logger.warning("Fast-path bar processing failed, falling back to generic parser: %s", e)
+            candlesticks = []
+
+    if not candlesticks:
+        for bar in bars:
+            try:
+                # Robust timestamp parsing for IB Gateway string format
+                if isinstance(bar.date, str):
+                    # Clean and normalize the date string
+                    date_str = bar.date.strip()
                 
-                # Handle various IB Gateway string formats
-                if ' ' in date_str:
-                    # Format: "20250804  19:16:21" or "20250804 19:16:21" (multiple spaces)
-                    # Clean up multiple spaces and normalize
-                    date_str = ' '.join(date_str.split())
-                    try:
-                        bar_datetime = datetime.strptime(date_str, "%Y%m%d %H:%M:%S")
-                    except ValueError:
+                    # Handle various IB Gateway string formats
+                    if ' ' in date_str:
+                        # Format: "20250804  19:16:21" or "20250804 19:16:21" (multiple spaces)
+                        # Clean up multiple spaces and normalize
+                        date_str = ' '.join(date_str.split())
                         try:
-                            # Try alternative format with dashes
-                            bar_datetime = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+                            bar_datetime = datetime.strptime(date_str, IB_DATETIME_FORMAT)
                         except ValueError:
-                            # Last resort: try with seconds
-                            bar_datetime = datetime.strptime(date_str, "%Y%m%d %H:%M:%S.%f")
-                else:
-                    # Date only format: "20250804"
-                    bar_datetime = datetime.strptime(date_str, "%Y%m%d")
+                            try:
+                                # Try alternative format with dashes
+                                bar_datetime = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+                            except ValueError:
+                                # Last resort: try with seconds
+                                bar_datetime = datetime.strptime(date_str, "%Y%m%d %H:%M:%S.%f")
+                    else:
+                        # Date only format: "20250804"
+                        bar_datetime = datetime.strptime(date_str, IB_DATE_FORMAT)
                 
-                # Convert to UTC timestamp using calendar.timegm for reliability
-                # This avoids timezone conversion issues with datetime.timestamp()
-                timestamp = calendar.timegm(bar_datetime.timetuple())
+                    # Convert to UTC timestamp using calendar.timegm for reliability
+                    # This avoids timezone conversion issues with datetime.timestamp()
+                    timestamp = calendar.timegm(bar_datetime.timetuple())
                 
-            elif isinstance(bar.date, (int, float)):
-                # If it's already a Unix timestamp, use it directly
-                timestamp = int(bar.date)
+                elif isinstance(bar.date, (int, float)):
+                    # If it's already a Unix timestamp, use it directly
+                    timestamp = int(bar.date)
                 
-            else:
-                # If it's a datetime object, convert to timestamp
-                if hasattr(bar.date, 'timestamp'):
-                    timestamp = int(bar.date.timestamp())
                 else:
-                    # Fallback: try to parse as string
-                    date_str = str(bar.date).strip()
-                    bar_datetime = datetime.strptime(date_str, "%Y%m%d %H:%M:%S")
-                    timestamp = calendar.timegm(bar_datetime.timetuple())
-            
-            # Enhanced logging for first few bars
-            if len(candlesticks) < 5:
-                logger.info(f"Processing bar {len(candlesticks)+1}:")
-                logger.info(f"  Raw bar.date: '{bar.date}' (type: {type(bar.date)})")
-                logger.info(f"  Converted timestamp: {timestamp}")
-                logger.info(f"  Timestamp as UTC date: {datetime.fromtimestamp(timestamp, tz=timezone.utc)}")
-                logger.info(f"  Timestamp validation - Expected range: 1700000000-1800000000 (2023-2027)")
-                logger.info(f"  Timestamp validation - Current value: {timestamp} ({'VALID' if 1700000000 <= timestamp <= 1800000000 else 'INVALID - MAJOR ISSUE'})")
-                logger.info(f"  Bar values: O={bar.open}, H={bar.high}, L={bar.low}, C={bar.close}, V={bar.volume}")
+                    # If it's a datetime object, convert to timestamp
+                    if hasattr(bar.date, 'timestamp'):
+                        timestamp = int(bar.date.timestamp())
+                    else:
+                        # Fallback: try to parse as string
+                        date_str = str(bar.date).strip()
+                        bar_datetime = datetime.strptime(date_str, IB_DATETIME_FORMAT)
+                        timestamp = calendar.timegm(bar_datetime.timetuple())
             
-            candlestick = CandlestickBar(
-                timestamp=timestamp,
-                open=float(bar.open),
-                high=float(bar.high),
-                low=float(bar.low),
-                close=float(bar.close),
-                volume=int(bar.volume)
-            )
-            candlesticks.append(candlestick)
+                # Enhanced logging for first few bars
+                if len(candlesticks) < 5:
+                    logger.info("Processing bar %s:", len(candlesticks)+1)
+                    logger.info("  Raw bar.date: '%s' (type: %s)", bar.date, type(bar.date))
+                    logger.info("  Converted timestamp: %s", timestamp)
+                    logger.info("  Timestamp as UTC date: %s", datetime.fromtimestamp(timestamp, tz=UTC))
+                    logger.info("  Timestamp validation - Expected range: 1700000000-1800000000 (2023-2027)")
+                    logger.info("  Timestamp validation - Current value: %s (%s)", timestamp, 'VALID' if 1700000000 <= timestamp <= 1800000000 else 'INVALID - MAJOR ISSUE')
+                    logger.info("  Bar values: O=%s, H=%s, L=%s, C=%s, V=%s", bar.open, bar.high, bar.low, bar.close, bar.volume)
             
-        except Exception as e:
-            logger.warning(f"Failed to process bar: {e}")
-            logger.warning(f"Bar data: date='{bar.date}' (type: {type(bar.date)}), open={bar.open}, high={bar.high}, low={bar.low}, close={bar.close}, volume={bar.volume}")
-            # Continue processing other bars instead of failing completely
-            continue
-    
-    # Sort bars by timestamp in descending order (newest first)
-    candlesticks.sort(key=lambda x: x.timestamp, reverse=True)
+                candlesticks.append({
+                    'timestamp': timestamp,
+                    'open': float(bar.open),
+                    'high': float(bar.high),
+                    'low': float(bar.low),
+                    'close': float(bar.close),
+                    'volume': int(bar.volume)
+                })
+
+            except Exception as e:
+                logger.warning("Failed to process bar: %s", e)
+                logger.warning("Bar data: date='%s' (type: %s), open=%s, high=%s, low=%s, close=%s, volume=%s", bar.date, type(bar.date), bar.open, bar.high, bar.low, bar.close, bar.volume)
+                # Continue processing other bars instead of failing completely
+                continue
     
-    logger.info(f"Successfully processed {len(candlesticks)} out of {len(bars)} bars for {symbol} {timeframe} {period}")
+    # Sort bars by timestamp in descending order (newest first) via a
+    # single C argsort instead of a keyed Python sort
     if candlesticks:
-        logger.info(f"Date range: {datetime.fromtimestamp(candlesticks[-1].timestamp, tz=timezone.utc)} to {datetime.fromtimestamp(candlesticks[0].timestamp, tz=timezone.utc)}")
-        logger.info(f"Sample timestamps: {candlesticks[0].timestamp} (newest), {candlesticks[-1].timestamp} (oldest)")
-        logger.info(f"Sample dates: {datetime.fromtimestamp(candlesticks[0].timestamp, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} (newest), {datetime.fromtimestamp(candlesticks[-1].timestamp, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} (oldest)")
-    else:
-        logger.error(f"No bars were successfully processed! Check timestamp format and IB Gateway configuration.")
+        ts = np.fromiter((c['timestamp'] for c in candlesticks), dtype=np.int64, count=len(candlesticks))
+        order = np.argsort(ts, kind='stable')[::-1]
+        candlesticks = [candlesticks[i] for i in order]
+    
+    # Guard the summary block so the fromtimestamp/strftime formatting is
+    # skipped entirely when INFO logging is disabled in production
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Successfully processed %s out of %s bars for %s %s %s", len(candlesticks), len(bars), symbol, timeframe, period)
+        if candlesticks:
+            logger.info("Date range: %s to %s", datetime.fromtimestamp(candlesticks[-1]['timestamp'], tz=UTC), datetime.fromtimestamp(candlesticks[0]['timestamp'], tz=UTC))
+            logger.info("Sample timestamps: %s (newest), %s (oldest)", candlesticks[0]['timestamp'], candlesticks[-1]['timestamp'])
+            logger.info("Sample dates: %s (newest), %s (oldest)", datetime.fromtimestamp(candlesticks[0]['timestamp'], tz=UTC).strftime('%Y-%m-%d %H:%M:%S UTC'), datetime.fromtimestamp(candlesticks[-1]['timestamp'], tz=UTC).strftime('%Y-%m-%d %H:%M:%S UTC'))
+    if not candlesticks:
+        logger.error("No bars were successfully processed! Check timestamp format and IB Gateway configuration.")
     
-    return HistoricalDataResponse(
+    return HistoricalDataResponse.model_construct(
         symbol=symbol,
         timeframe=timeframe,
         period=period,
         bars=candlesticks,
         count=len(candlesticks),
-        last_updated=datetime.now().isoformat()
+        last_updated=_now_iso()
     )
 
 def process_bars_with_date_range(bars, symbol: str, timeframe: str, start_date_str: str, end_date_str: str) -> HistoricalDataResponse:
@@ -679,9 +1076,9 @@ def process_bars_with_date_range(bars, symbol: str, timeframe: str, start_date_s
             # Simple approach: parse date without timezone conversion
             if isinstance(bar.date, str):
                 if ' ' in bar.date:
-                    bar_datetime = datetime.strptime(bar.date.strip(), "%Y%m%d %H:%M:%S")
+                    bar_datetime = datetime.strptime(bar.date.strip(), IB_DATETIME_FORMAT)
                 else:
-                    bar_datetime = datetime.strptime(bar.date, "%Y%m%d")
+                    bar_datetime = datetime.strptime(bar.date, IB_DATE_FORMAT)
                 timestamp = int(bar_datetime.timestamp())
                 
             elif isinstance(bar.date, (int, float)):
@@ -693,155 +1090,222 @@ def process_bars_with_date_range(bars, symbol: str, timeframe: str, start_date_s
                     timestamp = int(bar.date.timestamp())
                     bar_datetime = bar.date
                 else:
-                    bar_datetime = datetime.strptime(str(bar.date), "%Y%m%d %H:%M:%S")
+                    bar_datetime = datetime.strptime(str(bar.date), IB_DATETIME_FORMAT)
                     timestamp = int(bar_datetime.timestamp())
             
             # Check if bar is within date range
             if start_dt <= bar_datetime <= end_dt:
-                candlestick = CandlestickBar(
-                    timestamp=timestamp,
-                    open=float(bar.open),
-                    high=float(bar.high),
-                    low=float(bar.low),
-                    close=float(bar.close),
-                    volume=int(bar.volume)
-                )
-                candlesticks.append(candlestick)
+                candlesticks.append({
+                    'timestamp': timestamp,
+                    'open': float(bar.open),
+                    'high': float(bar.high),
+                    'low': float(bar.low),
+                    'close': float(bar.close),
+                    'volume': int(bar.volume)
+                })
                 
         except Exception as e:
-            logger.error(f"Error processing bar for date range: {e}, bar.date={bar.date}")
+            logger.error("Error processing bar for date range: %s, bar.date=%s", e, bar.date)
             continue
     
-    # Sort bars by timestamp in descending order (newest first)
-    candlesticks.sort(key=lambda x: x.timestamp, reverse=True)
-    
-    logger.info(f"Processed {len(candlesticks)} bars for {symbol} {timeframe} date range {start_date_str} to {end_date_str}")
+    # Sort bars by timestamp in descending order (newest first) via a
+    # single C argsort instead of a keyed Python sort
     if candlesticks:
-        logger.info(f"Date range: {datetime.fromtimestamp(candlesticks[-1].timestamp)} to {datetime.fromtimestamp(candlesticks[0].timestamp)}")
+        ts = np.fromiter((c['timestamp'] for c in candlesticks), dtype=np.int64, count=len(candlesticks))
+        order = np.argsort(ts, kind='stable')[::-1]
+        candlesticks = [candlesticks[i] for i in order]
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processed %s bars for %s %s date range %s to %s", len(candlesticks), symbol, timeframe, start_date_str, end_date_str)
+        if candlesticks:
+            logger.info("Date range: %s to %s", datetime.fromtimestamp(candlesticks[-1]['timestamp']), datetime.fromtimestamp(candlesticks[0]['timestamp']))
     
-    return HistoricalDataResponse(
+    return HistoricalDataResponse.model_construct(
         symbol=symbol,
         timeframe=timeframe,
         period="CUSTOM",  # Indicate it's a custom date range
         bars=candlesticks,
         count=len(candlesticks),
-        last_updated=datetime.now().isoformat()
+        last_updated=_now_iso()
     )
 
+def bars_to_arrays(bars):
+    """Convert raw IB bars into numpy timestamp/OHLCV arrays in one pass
+
+    Dates are parsed with a single vectorized pd.to_datetime call (C
+    parser) instead of per-bar strptime, with the format detected from the
+    first bar. Returns (timestamps, opens, highs, lows, closes, volumes,
+    valid) where valid flags bars whose date parsed successfully -
+    equivalent to the old per-bar try/except that skipped bad bars.
+    """
+    n = len(bars)
+    raw_dates = [bar.date for bar in bars]
+    first = raw_dates[0]
+
+    if isinstance(first, str):
+        fmt = IB_DATETIME_FORMAT if ' ' in first else IB_DATE_FORMAT
+        parsed = pd.to_datetime(raw_dates, format=fmt, utc=True, errors='coerce')
+    elif isinstance(first, (int, float)):
+        parsed = pd.to_datetime(raw_dates, unit='s', utc=True, errors='coerce')
+    else:
+        # datetime objects or anything else pandas understands
+        parsed = pd.to_datetime(raw_dates, utc=True, errors='coerce')
+
+    valid = np.asarray(parsed.notna())
+    timestamps = parsed.as_unit('s').asi8  # Unix seconds
+
+    # Prices stay float64 here: these arrays feed the response payload
+    # and the backtest DataFrame, where float32 representation noise
+    # (150.9 -> 150.89999389648438) would leak onto the wire. The
+    # indicator pipeline downcasts its own copies to float32 at its
+    # call boundary, where the memory-traffic saving actually applies
+    opens = np.fromiter((bar.open for bar in bars), dtype=np.float64, count=n)
+    highs = np.fromiter((bar.high for bar in bars), dtype=np.float64, count=n)
+    lows = np.fromiter((bar.low for bar in bars), dtype=np.float64, count=n)
+    closes = np.fromiter((bar.close for bar in bars), dtype=np.float64, count=n)
+    volumes = np.fromiter((bar.volume for bar in bars), dtype=np.int64, count=n)
+
+    return timestamps, opens, highs, lows, closes, volumes, valid
+
+# Optional indicator fields on CandlestickBar, in the order the frontend expects
+INDICATOR_FIELDS = [
+    'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi',
+    'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower',
+    'stoch_k', 'stoch_d', 'atr', 'obv', 'vwap', 'volume_sma'
+]
+
+def candlesticks_from_arrays(timestamps, opens, highs, lows, closes, volumes,
+                             indicator_cols: Dict[str, np.ndarray] = None) -> List[Dict]:
+    """Build bar dicts (CandlestickBar shape) straight from numpy column arrays
+
+    Scalars are indexed out of the column arrays directly - no DataFrame
+    or intermediate dicts-of-rows. Valid-value masks for indicator columns
+    are computed in bulk, one per column. Plain dicts keep model
+    allocation out of the hot path; orjson encodes them directly and the
+    CandlestickBar model remains the documented schema.
+    """
+    if not indicator_cols:
+        # Common no-indicator path: no inner field loop; tolist()
+        # converts each column to Python scalars in bulk
+        return [
+            {'timestamp': float(t), 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+            for t, o, h, l, c, v in zip(
+                timestamps.tolist(), opens.tolist(), highs.tolist(),
+                lows.tolist(), closes.tolist(), volumes.tolist())
+        ]
+
+    # tolist() converts each column to Python scalars in one C pass, so
+    # the row loop indexes plain floats/ints - no per-cell numpy boxing
+    # and no redundant float()/int() casts
+    present_indicators = [
+        (f, col.tolist(), ~np.isnan(col))
+        for f, col in ((f, np.asarray(indicator_cols[f], dtype=np.float64))
+                       for f in INDICATOR_FIELDS if f in indicator_cols)
+    ]
+    ts_list = timestamps.tolist()
+    o_list = opens.tolist()
+    h_list = highs.tolist()
+    l_list = lows.tolist()
+    c_list = closes.tolist()
+    v_list = volumes.tolist()
+
+    candlesticks = []
+    for i in range(len(ts_list)):
+        candlestick_data = {
+            'timestamp': float(ts_list[i]),
+            'open': o_list[i],
+            'high': h_list[i],
+            'low': l_list[i],
+            'close': c_list[i],
+            'volume': v_list[i]
+        }
+
+        # Add indicator values if they exist and are not NaN
+        for field, col, notna in present_indicators:
+            if notna[i]:
+                candlestick_data[field] = col[i]
+
+        candlesticks.append(candlestick_data)
+
+    return candlesticks
+
 def process_bars_with_indicators(bars, symbol: str, timeframe: str, period: str, indicators: List[str] = None) -> HistoricalDataResponse:
     """Process IB bars into candlestick data with technical indicators"""
     try:
-        logger.info(f"process_bars_with_indicators called with {len(bars)} bars, indicators: {indicators}")
-        
-        # Convert bars to DataFrame for indicator calculations
-        bars_data = []
-        for i, bar in enumerate(bars):
-            try:
-                if i == 0:  # Log first bar details for debugging
-                    logger.info(f"Processing first bar: date={bar.date}, open={bar.open}, high={bar.high}, low={bar.low}, close={bar.close}, volume={bar.volume}")
-                
-                # Simple timestamp handling - no timezone conversion
-                if isinstance(bar.date, str):
-                    if ' ' in bar.date:
-                        bar_datetime = datetime.strptime(bar.date.strip(), "%Y%m%d %H:%M:%S")
-                    else:
-                        bar_datetime = datetime.strptime(bar.date, "%Y%m%d")
-                    timestamp = int(bar_datetime.timestamp())
-                    
-                elif isinstance(bar.date, (int, float)):
-                    timestamp = int(bar.date)
-                    
-                else:
-                    if hasattr(bar.date, 'timestamp'):
-                        timestamp = int(bar.date.timestamp())
-                    else:
-                        bar_datetime = datetime.strptime(str(bar.date), "%Y%m%d %H:%M:%S")
-                        timestamp = int(bar_datetime.timestamp())
-                
-                bars_data.append({
-                    'timestamp': timestamp,
-                    'open': float(bar.open),
-                    'high': float(bar.high),
-                    'low': float(bar.low),
-                    'close': float(bar.close),
-                    'volume': int(bar.volume)
-                })
-            except Exception as e:
-                logger.warning(f"Error processing bar {i}: {e}, bar={bar}")
-                continue
+        logger.info("process_bars_with_indicators called with %s bars, indicators: %s", len(bars), indicators)
         
-        logger.info(f"Successfully processed {len(bars_data)} bars from {len(bars)} raw bars")
-        
-        if not bars_data:
-            return HistoricalDataResponse(
+        if not bars:
+            return HistoricalDataResponse.model_construct(
                 symbol=symbol,
                 timeframe=timeframe,
                 period=period,
                 bars=[],
                 count=0,
-                last_updated=datetime.now().isoformat()
+                last_updated=_now_iso()
             )
-        
-        # Calculate indicators if requested
+
+        # Parse all bar dates with one vectorized pd.to_datetime call and
+        # pull OHLCV into numpy arrays instead of a per-bar strptime ladder
+        timestamps, opens, highs, lows, closes, volumes, valid = bars_to_arrays(bars)
+
+        if not valid.all():
+            dropped = len(bars) - int(valid.sum())
+            logger.warning("Dropped %s bars with unparseable dates", dropped)
+            timestamps = timestamps[valid]
+            opens = opens[valid]
+            highs = highs[valid]
+            lows = lows[valid]
+            closes = closes[valid]
+            volumes = volumes[valid]
+
+        logger.info("Successfully processed %s bars from %s raw bars", timestamps.size, len(bars))
+
+        if timestamps.size == 0:
+            return HistoricalDataResponse.model_construct(
+                symbol=symbol,
+                timeframe=timeframe,
+                period=period,
+                bars=[],
+                count=0,
+                last_updated=_now_iso()
+            )
+
+        # Guarantee chronological order for rolling-indicator math
+        order = np.argsort(timestamps, kind='stable')
+        timestamps, opens, highs, lows, closes, volumes = (
+            arr[order] for arr in (timestamps, opens, highs, lows, closes, volumes))
+
+        # Calculate indicators if requested - array-native, no DataFrame
+        # round-trip
+        indicator_cols = None
         if indicators and len(indicators) > 0:
-            # Convert to DataFrame for indicator calculations
-            df = pd.DataFrame(bars_data)
-            
-            # Calculate indicators
-            df_with_indicators = indicator_calculator.calculate_indicators(df, indicators)
-            
-            # Convert back to CandlestickBar objects
-            candlesticks = []
-            for _, row in df_with_indicators.iterrows():
-                # Create base candlestick data
-                candlestick_data = {
-                    'timestamp': float(row['timestamp']),
-                    'open': float(row['open']),
-                    'high': float(row['high']),
-                    'low': float(row['low']),
-                    'close': float(row['close']),
-                    'volume': int(row['volume'])
-                }
-                
-                # Add indicator values if they exist and are not NaN
-                indicator_fields = [
-                    'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi', 
-                    'macd', 'macd_signal', 'macd_histogram',
-                    'bb_upper', 'bb_middle', 'bb_lower',
-                    'stoch_k', 'stoch_d', 'atr', 'obv', 'vwap', 'volume_sma'
-                ]
-                
-                for field in indicator_fields:
-                    if field in row and pd.notna(row[field]):
-                        candlestick_data[field] = float(row[field])
-                
-                candlestick = CandlestickBar(**candlestick_data)
-                candlesticks.append(candlestick)
-        else:
-            # No indicators requested, use standard processing
-            candlesticks = []
-            for bar_data in bars_data:
-                candlestick = CandlestickBar(**bar_data)
-                candlesticks.append(candlestick)
-        
-        # Sort bars by timestamp in descending order (newest first)
-        candlesticks.sort(key=lambda x: x.timestamp, reverse=True)
+            indicator_cols = indicator_calculator.calculate_indicators_incremental(
+                symbol, timeframe, timestamps, highs, lows, closes, volumes, indicators)
+
+        candlesticks = candlesticks_from_arrays(
+            timestamps, opens, highs, lows, closes, volumes, indicator_cols)
+
+        # DataFrame was built in chronological order, so newest-first is
+        # just a reversal - no keyed sort needed
+        candlesticks.reverse()
         
-        logger.info(f"Processed {len(candlesticks)} bars with indicators for {symbol} {timeframe} {period}")
-        if candlesticks:
-            logger.info(f"Date range: {datetime.fromtimestamp(candlesticks[-1].timestamp)} to {datetime.fromtimestamp(candlesticks[0].timestamp)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processed %s bars with indicators for %s %s %s", len(candlesticks), symbol, timeframe, period)
+            if candlesticks:
+                logger.info("Date range: %s to %s", datetime.fromtimestamp(candlesticks[-1]['timestamp']), datetime.fromtimestamp(candlesticks[0]['timestamp']))
         
-        return HistoricalDataResponse(
+        return HistoricalDataResponse.model_construct(
             symbol=symbol,
             timeframe=timeframe,
             period=period,
             bars=candlesticks,
             count=len(candlesticks),
-            last_updated=datetime.now().isoformat()
+            last_updated=_now_iso()
         )
         
     except Exception as e:
-        logger.error(f"Error processing bars with indicators: {e}")
+        logger.error("Error processing bars with indicators: %s", e)
         # Fallback to standard processing
         return process_bars(bars, symbol, timeframe, period)
 
@@ -851,111 +1315,67 @@ def process_bars_with_date_range_and_indicators(bars, symbol: str, timeframe: st
         start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date_str, "%Y-%m-%d")
         end_dt = end_dt.replace(hour=23, minute=59, second=59)
-        
-        # Filter bars by date range and convert to DataFrame format
-        bars_data = []
-        for bar in bars:
-            try:
-                # Simple timestamp handling - no timezone conversion
-                if isinstance(bar.date, str):
-                    if ' ' in bar.date:
-                        bar_datetime = datetime.strptime(bar.date.strip(), "%Y%m%d %H:%M:%S")
-                    else:
-                        bar_datetime = datetime.strptime(bar.date, "%Y%m%d")
-                    timestamp = int(bar_datetime.timestamp())
-                    
-                elif isinstance(bar.date, (int, float)):
-                    timestamp = int(bar.date)
-                    bar_datetime = datetime.fromtimestamp(timestamp)
-                    
-                else:
-                    if hasattr(bar.date, 'timestamp'):
-                        timestamp = int(bar.date.timestamp())
-                        bar_datetime = bar.date
-                    else:
-                        bar_datetime = datetime.strptime(str(bar.date), "%Y%m%d %H:%M:%S")
-                        timestamp = int(bar_datetime.timestamp())
-                
-                # Check if bar is within our date range
-                if start_dt <= bar_datetime <= end_dt:
-                    bars_data.append({
-                        'timestamp': timestamp,
-                        'open': float(bar.open),
-                        'high': float(bar.high),
-                        'low': float(bar.low),
-                        'close': float(bar.close),
-                        'volume': int(bar.volume)
-                    })
-            except Exception as e:
-                logger.warning(f"Error processing bar for date range: {e}, bar.date={bar.date}")
-                continue
-        
-        if not bars_data:
-            return HistoricalDataResponse(
+
+        # Parse all bar dates in one vectorized call and apply the date
+        # range as a numpy mask instead of per-bar strptime + comparisons
+        timestamps, opens, highs, lows, closes, volumes, valid = bars_to_arrays(bars)
+
+        dropped = len(bars) - int(valid.sum())
+        if dropped:
+            logger.warning("Dropped %s bars with unparseable dates for date range request", dropped)
+
+        start_ts = calendar.timegm(start_dt.timetuple())
+        end_ts = calendar.timegm(end_dt.timetuple())
+        mask = valid & (timestamps >= start_ts) & (timestamps <= end_ts)
+
+        if not mask.any():
+            return HistoricalDataResponse.model_construct(
                 symbol=symbol,
                 timeframe=timeframe,
                 period="CUSTOM",
                 bars=[],
                 count=0,
-                last_updated=datetime.now().isoformat()
+                last_updated=_now_iso()
             )
         
-        # Calculate indicators if requested
+        timestamps, opens, highs, lows, closes, volumes = (
+            arr[mask] for arr in (timestamps, opens, highs, lows, closes, volumes))
+
+        # Guarantee chronological order for rolling-indicator math
+        order = np.argsort(timestamps, kind='stable')
+        timestamps, opens, highs, lows, closes, volumes = (
+            arr[order] for arr in (timestamps, opens, highs, lows, closes, volumes))
+
+        # Calculate indicators if requested - array-native, no DataFrame
+        # round-trip
+        indicator_cols = None
         if indicators and len(indicators) > 0:
-            df = pd.DataFrame(bars_data)
-            df_with_indicators = indicator_calculator.calculate_indicators(df, indicators)
-            
-            # Convert back to CandlestickBar objects
-            candlesticks = []
-            for _, row in df_with_indicators.iterrows():
-                candlestick_data = {
-                    'timestamp': float(row['timestamp']),
-                    'open': float(row['open']),
-                    'high': float(row['high']),
-                    'low': float(row['low']),
-                    'close': float(row['close']),
-                    'volume': int(row['volume'])
-                }
-                
-                # Add indicator values if they exist and are not NaN
-                indicator_fields = [
-                    'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi', 
-                    'macd', 'macd_signal', 'macd_histogram',
-                    'bb_upper', 'bb_middle', 'bb_lower',
-                    'stoch_k', 'stoch_d', 'atr', 'obv', 'vwap', 'volume_sma'
-                ]
-                
-                for field in indicator_fields:
-                    if field in row and pd.notna(row[field]):
-                        candlestick_data[field] = float(row[field])
-                
-                candlestick = CandlestickBar(**candlestick_data)
-                candlesticks.append(candlestick)
-        else:
-            # No indicators requested
-            candlesticks = []
-            for bar_data in bars_data:
-                candlestick = CandlestickBar(**bar_data)
-                candlesticks.append(candlestick)
-        
-        # Sort bars by timestamp in descending order (newest first)
-        candlesticks.sort(key=lambda x: x.timestamp, reverse=True)
+            indicator_cols = indicator_calculator.calculate_indicators_incremental(
+                symbol, timeframe, timestamps, highs, lows, closes, volumes, indicators)
+
+        candlesticks = candlesticks_from_arrays(
+            timestamps, opens, highs, lows, closes, volumes, indicator_cols)
+
+        # DataFrame was built in chronological order, so newest-first is
+        # just a reversal - no keyed sort needed
+        candlesticks.reverse()
         
-        logger.info(f"Processed {len(candlesticks)} bars with date range and indicators for {symbol} {timeframe}")
-        if candlesticks:
-            logger.info(f"Date range: {datetime.fromtimestamp(candlesticks[-1].timestamp)} to {datetime.fromtimestamp(candlesticks[0].timestamp)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processed %s bars with date range and indicators for %s %s", len(candlesticks), symbol, timeframe)
+            if candlesticks:
+                logger.info("Date range: %s to %s", datetime.fromtimestamp(candlesticks[-1]['timestamp']), datetime.fromtimestamp(candlesticks[0]['timestamp']))
         
-        return HistoricalDataResponse(
+        return HistoricalDataResponse.model_construct(
             symbol=symbol,
             timeframe=timeframe,
             period="CUSTOM",
             bars=candlesticks,
             count=len(candlesticks),
-            last_updated=datetime.now().isoformat()
+            last_updated=_now_iso()
         )
         
     except Exception as e:
-        logger.error(f"Error processing bars with date range and indicators: {e}")
+        logger.error("Error processing bars with date range and indicators: %s", e)
         # Fallback to standard date range processing
         return process_bars_with_date_range(bars, symbol, timeframe, start_date_str, end_date_str)
 
@@ -964,21 +1384,55 @@ def process_bars_with_date_range_and_indicators(bars, symbol: str, timeframe: st
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("Starting TWS API Service...")
-    logger.info(f"Configuration: {IB_HOST}:{IB_PORT}, Client ID: {IB_CLIENT_ID}")
-    
-    logger.info("TWS API Service ready - connection will be established on first API call")
-    
+    logger.info("Configuration: %s:%s, Client ID: %s", IB_HOST, IB_PORT, IB_CLIENT_ID)
+
+    # Establish the long-lived connection in the background so the
+    # service is ready to serve (and pass readiness probes) immediately;
+    # retries back off exponentially while the gateway is down, and any
+    # API call can still trigger the lazy connect path itself
+    async def connect_with_backoff():
+        attempt = 0
+        while True:
+            try:
+                await asyncio.get_running_loop().run_in_executor(tws_executor, get_ib_connection)
+                logger.info("TWS API Service ready - persistent IB Gateway connection established")
+                return
+            except Exception as e:
+                delay = min(30, 2 ** attempt)
+                attempt += 1
+                logger.warning("IB Gateway not available (%s) - retrying in %ss", e, delay)
+                await asyncio.sleep(delay)
+
+    startup_connect_task = asyncio.create_task(connect_with_backoff())
+
+    # Periodically release gateway clientId slots held by idle pool
+    # clients; they are recreated lazily on the next search burst
+    async def evict_idle_pool_clients():
+        while True:
+            await asyncio.sleep(60)
+            try:
+                ib_pool.evict_idle()
+            except Exception as e:
+                logger.error("Pool idle eviction failed: %s", e)
+
+    eviction_task = asyncio.create_task(evict_idle_pool_clients())
+
     yield
-    
+
     # Cleanup on shutdown
     logger.info("Shutting down TWS API Service...")
+    startup_connect_task.cancel()
+    eviction_task.cancel()
     disconnect_ib()
+    ib_pool.disconnect_all()
 
-# FastAPI app
+# FastAPI app. orjson as the default response class so large payloads
+# (contract searches, account data) encode in C instead of stdlib json
 app = FastAPI(
     title="TradingApp TWS API Service",
     description="Interactive Brokers TWS API service for TradingApp",
     version="4.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -991,17 +1445,105 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Large bar payloads are highly repetitive JSON (the same six keys per
+# bar), which gzip shrinks by an order of magnitude; small responses
+# skip compression entirely via the size floor
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Health check endpoint - no IB connection test
+def gateway_health_sync():
+    """Probe IB Gateway over the persistent connection
+
+    Sends reqCurrentTime on the already-open socket and waits for the
+    currentTime callback - a full round-trip through the gateway for the
+    cost of one tiny message, with no connect/disconnect handshake. An
+    unconnected client reports unhealthy immediately rather than
+    triggering the reconnect ladder from a monitoring probe.
+    """
+    ib = ib_client
+    if not ib or not ib.isConnected():
+        return {
+            "healthy": False,
+            "detail": "Not connected to IB Gateway",
+            "timestamp": _now_iso()
+        }
+
+    ping_done = threading.Event()
+    ib.current_time_event = ping_done
+    started = time.monotonic()
+    try:
+        ib.reqCurrentTime()
+        responded = ping_done.wait(timeout=2)
+    finally:
+        ib.current_time_event = None
+
+    latency_ms = round((time.monotonic() - started) * 1000, 1)
+    if responded:
+        ib.last_healthy_at = time.monotonic()
+    return {
+        "healthy": responded,
+        "latency_ms": latency_ms,
+        "server_time": ib.server_time if responded else None,
+        "detail": None if responded else "Gateway did not answer reqCurrentTime within 2s",
+        "timestamp": _now_iso()
+    }
+
+@app.get("/gateway-health")
+async def gateway_health():
+    """Probe IB Gateway responsiveness (round-trip over the open socket)"""
+    if ib_client and ib_client.isConnected():
+        return await run_tws_operation(gateway_health_sync)
+
+    # No API session: probe the TCP port directly so monitoring can tell
+    # a down gateway from a merely unconnected service. The async connect
+    # waits on the selector rather than blocking a thread, and it never
+    # triggers the reconnect ladder
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(IB_HOST, IB_PORT), timeout=1.0)
+        writer.close()
+        await writer.wait_closed()
+        reachable = True
+    except (OSError, asyncio.TimeoutError):
+        reachable = False
+
+    return {
+        "healthy": False,
+        "reachable": reachable,
+        "detail": ("IB Gateway port is reachable but no API session is connected"
+                   if reachable else f"Cannot reach IB Gateway at {IB_HOST}:{IB_PORT}"),
+        "timestamp": _now_iso()
+    }
+
+# Static response skeletons built once at import; the handlers copy and
+# fill in only the dynamic fields. Healthcheckers poll these routes
+# constantly, so don't rebuild the nested dicts per hit
+HEALTH_SKELETON = {
+    "status": "healthy",
+    "service": "TWS API Service",
+    "version": "4.0.0",
+    "timestamp": None,
+    "note": "Service is running - IB Gateway connection tested only when endpoints are called"
+}
+
+ROOT_SKELETON = {
+    "service": "TradingApp TWS API Service",
+    "version": "4.0.0",
+    "status": "running",
+    "config": {
+        "ib_host": IB_HOST,
+        "ib_port": IB_PORT,
+        "client_id": IB_CLIENT_ID
+    },
+    "connection": None
+}
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint - service status only, no IB Gateway connection test"""
-    return {
-        "status": "healthy",
-        "service": "TWS API Service",
-        "version": "4.0.0",
-        "timestamp": datetime.now().isoformat(),
-        "note": "Service is running - IB Gateway connection tested only when endpoints are called"
-    }
+    response = HEALTH_SKELETON.copy()
+    response["timestamp"] = _now_iso()
+    return response
 
 # Timezone configuration endpoint for debugging
 @app.get("/timezone-info")
@@ -1041,30 +1583,24 @@ async def timezone_info():
 @app.get("/")
 async def root():
     """Service information"""
-    return {
-        "service": "TradingApp TWS API Service",
-        "version": "4.0.0",
-        "status": "running",
-        "config": {
-            "ib_host": IB_HOST,
-            "ib_port": IB_PORT,
-            "client_id": IB_CLIENT_ID
-        },
-        "connection": connection_status
-    }
+    response = ROOT_SKELETON.copy()
+    response["connection"] = connection_status
+    return response
 
 # Connection status endpoint
 @app.get("/connection", response_model=ConnectionInfo)
 async def get_connection_status():
     """Get connection status"""
+    # Bind one snapshot so all fields come from the same status rebind
+    cs = connection_status
     return ConnectionInfo(
-        connected=connection_status['connected'],
+        connected=cs['connected'],
         host=IB_HOST,
         port=IB_PORT,
         client_id=IB_CLIENT_ID,
-        last_connected=connection_status['last_connected'],
-        last_error=connection_status['last_error'],
-        connection_count=connection_status['connection_count']
+        last_connected=cs['last_connected'],
+        last_error=cs['last_error'],
+        connection_count=cs['connection_count']
     )
 
 # Connect endpoint
@@ -1072,7 +1608,10 @@ async def get_connection_status():
 async def connect():
     """Manually connect to IB Gateway"""
     try:
-        ib = get_ib_connection()
+        # The retry ladder can block for tens of seconds, so it runs on
+        # the TWS worker; connection_lock already serializes racing
+        # callers so only one runs the ladder
+        await run_tws_operation(get_ib_connection)
         return {
             "status": "connected",
             "message": "Successfully connected to IB Gateway",
@@ -1095,30 +1634,60 @@ async def connect():
 @app.post("/disconnect")
 async def disconnect():
     """Manually disconnect from IB Gateway"""
-    disconnect_ib()
+    await run_tws_operation(disconnect_ib)
     return {
         "status": "disconnected",
         "message": "Disconnected from IB Gateway"
     }
 
+# Dedicated single-thread executor for TWS API operations. The IB client
+# serializes on one socket anyway, so one worker matches the real
+# concurrency, keeps TWS calls from queueing behind unrelated work in
+# the default pool, and leaves that pool free for CPU-side work
+tws_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tws')
+
+# Backpressure for the TWS worker: the single thread already serializes
+# IB traffic, but its queue is unbounded - beyond this many waiting
+# operations, fail fast instead of letting every handler pile up behind
+# a slow gateway
+TWS_MAX_PENDING = int(os.getenv('IB_MAX_INFLIGHT', '16'))
+tws_backpressure = asyncio.Semaphore(TWS_MAX_PENDING)
+
 # Helper function to run TWS API operations in executor
 async def run_tws_operation(operation):
-    """Run TWS API operation in a separate thread"""
-    
+    """Run TWS API operation on the dedicated TWS thread"""
+
     def run_with_thread():
         """Run the operation in a thread"""
         try:
             return operation()
         except Exception as e:
-            logger.error(f"TWS API operation failed: {e}")
+            logger.error("TWS API operation failed: %s", e)
             raise e
-    
+
+    if tws_backpressure.locked():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="TWS request queue is full - try again shortly"
+        )
+
     # Run the operation in a thread
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, run_with_thread)
+    async with tws_backpressure:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(tws_executor, run_with_thread)
+
+# Contract searches run against the client pool rather than the primary
+# connection, so they get their own workers - one per pooled session -
+# and overlapping searches genuinely run in parallel
+search_executor = ThreadPoolExecutor(max_workers=IB_POOL_SIZE, thread_name_prefix='ib-search')
+
+async def run_search_operation(operation):
+    """Run a pool-backed contract search on a search worker thread"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(search_executor, operation)
 
 # Historical data endpoint
-@app.get("/market-data/history", response_model=HistoricalDataResponse)
+@app.get("/market-data/history", response_model=HistoricalDataResponse, response_class=ORJSONResponse)
 async def get_historical_data(
     symbol: str, 
     timeframe: str, 
@@ -1189,149 +1758,236 @@ async def get_historical_data(
         # Validate basic request (for period-based requests)
         if has_period:
             request = MarketDataRequest(symbol=symbol, timeframe=timeframe, period=period)
+
+        # Serve repeat requests from the encoded response cache - closed
+        # bars are immutable, so within one bar's TTL the whole IB
+        # round-trip and indicator pipeline can be skipped
+        # Key on every parameter that changes which bars IB returns -
+        # the contract fields matter too (ES the future is not ES the
+        # stock), mirroring the qualified-contract cache key
+        history_key = (symbol.upper(), secType, exchange, currency,
+                       timeframe, period if has_period else None,
+                       start_date, end_date, tuple(sorted(indicator_list)), account_mode)
+        cached_response = history_cache.get(history_key)
+        if cached_response and (time.time() - cached_response[0]) < history_cache_ttl(timeframe):
+            logger.info("Serving cached history response for %s", history_key)
+            return Response(content=cached_response[1], media_type="application/json")
+
+        # Single-flight the fetch: concurrent identical requests share
+        # one IB round-trip, mirroring the account-endpoint coalescing.
+        # The winner populates the encoded-response cache and every
+        # waiter gets the same body (or the same exception). The body is
+        # pure blocking ibapi work, so it runs on the TWS worker thread
+        # rather than stalling the event loop for the duration
+        def fetch_and_encode() -> bytes:
+            # get_ib_connection verifies (and if needed re-establishes)
+            # the session or raises 503 itself, so no separate
+            # isConnected() recheck is needed here
+            ib = get_ib_connection()
+
+            # Set market data type based on account mode. Fired before contract
+            # qualification - it does not depend on the contract, so its
+            # settling time overlaps the contract-details wait instead of
+            # adding a sleep of its own
+            if account_mode.lower() == 'live':
+                # Request live/real-time data (type 1)
+                ib.reqMarketDataType(1)
+                logger.info("Set market data type to live (type 1) for historical data")
+            else:
+                # Request delayed data (type 3) for paper trading
+                ib.reqMarketDataType(3)
+                logger.info("Set market data type to delayed (type 3) for historical data")
+
+            # Create contract
+            logger.info("Requesting historical data for contract: %s (%s) on %s in %s", symbol, secType, exchange, currency)
+
+            # Check the qualified contract cache before hitting IB Gateway
+            contract_key = get_cache_key(symbol, secType, exchange, currency)
+            cached_qualified = contract_cache.get(contract_key)
+            if cached_qualified and (time.time() - cached_qualified[0]) < contract_cache_ttl:
+                qualified_contract = cached_qualified[1]
+                logger.info("Using cached qualified contract for %s", contract_key)
+            else:
+                contract = cached_contract(symbol.upper(), secType, exchange, currency)
+
+                # Clear previous contract details
+                ib.contracts = []
+
+                # Request contract details to qualify the contract, waking as soon
+                # as contractDetailsEnd fires instead of a fixed sleep
+                request_contract_details(ib, 1, contract)
+
+                logger.info("Contract details request completed. Found %s contracts", len(ib.contracts))
+
+                if not ib.contracts:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Symbol {symbol} not found"
+                    )
+
+                qualified_contract = ib.contracts[0]
+                contract_cache[contract_key] = (time.time(), qualified_contract)
+
+            # Prepare data for IB request
+            ib_timeframe = convert_timeframe(timeframe)
+            data_type = get_data_type_for_account_mode(account_mode)
+            data_source = get_market_data_source(account_mode)
         
-        # Get connection
-        ib = get_ib_connection()
-        
-        # Verify connection is healthy
-        if not ib.isConnected():
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="IB Gateway connection is not available"
-            )
-        
-        logger.info(f"IB connection verified - connected: {ib.isConnected()}")
-        
-        # Create contract
-        contract = create_contract(symbol.upper(), secType, exchange, currency)
-        logger.info(f"Requesting historical data for contract: {symbol} ({secType}) on {exchange} in {currency}")
-        
-        # Clear previous contract details
-        ib.contracts = []
-        
-        # Request contract details to qualify the contract
-        ib.reqContractDetails(1, contract)
-        time.sleep(2)  # Wait for contract details
-        
-        logger.info(f"Contract details request completed. Found {len(ib.contracts)} contracts")
-        
-        if not ib.contracts:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Symbol {symbol} not found"
-            )
-        
-        qualified_contract = ib.contracts[0]
-        
-        # Prepare data for IB request
-        ib_timeframe = convert_timeframe(timeframe)
-        data_type = get_data_type_for_account_mode(account_mode)
-        data_source = get_market_data_source(account_mode)
-        
-        # Determine duration and end date for IB request
-        if has_date_range:
-            # For date range requests
-            duration_days = (end_dt - start_dt).days
-            ib_duration = f"{duration_days} D"
-            end_date_str = end_dt.strftime("%Y%m%d %H:%M:%S")
+            # Determine duration and end date for IB request
+            if has_date_range:
+                # For date range requests
+                duration_days = (end_dt - start_dt).days
+                ib_duration = f"{duration_days} D"
+                end_date_str = end_dt.strftime(IB_DATETIME_FORMAT)
             
-            logger.info(f"Requesting historical data for {symbol} - {data_type} ({account_mode} mode)")
-            logger.info(f"Date Range: {start_date} to {end_date} ({duration_days} days), Timeframe: {timeframe} -> {ib_timeframe}")
-        else:
-            # For period-based requests
-            ib_duration = convert_period(period)
-            end_date_str = ''  # Empty string means "now"
+                logger.info("Requesting historical data for %s - %s (%s mode)", symbol, data_type, account_mode)
+                logger.info("Date Range: %s to %s (%s days), Timeframe: %s -> %s", start_date, end_date, duration_days, timeframe, ib_timeframe)
+            else:
+                # For period-based requests
+                ib_duration = convert_period(period)
+                end_date_str = ''  # Empty string means "now"
             
-            logger.info(f"Requesting historical data for {symbol} - {data_type} ({account_mode} mode)")
-            logger.info(f"Period: {period} -> {ib_duration}, Timeframe: {timeframe} -> {ib_timeframe}")
-        
-        # Set market data type based on account mode
-        if account_mode.lower() == 'live':
-            # Request live/real-time data (type 1)
-            ib.reqMarketDataType(1)
-            logger.info("Set market data type to live (type 1) for historical data")
-        else:
-            # Request delayed data (type 3) for paper trading
-            ib.reqMarketDataType(3)
-            logger.info("Set market data type to delayed (type 3) for historical data")
-        
-        # Small delay to allow market data type to be set
-        time.sleep(1)
-        
-        # Clear previous historical data
-        ib.historical_data = []
-        
-        # Use string format (formatDate=1) to avoid IB Gateway conversion issues
-        # formatDate: 1 for YYYYMMDD HH:MM:SS format, 2 for Unix timestamp format
-        # Using format 1 to avoid "unconverted data remains" errors from IB Gateway
-        format_date = 1  # Force string format for compatibility
-        
-        ib.reqHistoricalData(
-            2,  # reqId
-            qualified_contract,
-            end_date_str,  # endDateTime (empty string for "now", or specific date)
-            ib_duration,  # duration
-            ib_timeframe,
-            'TRADES',
-            1,  # useRTH
-            format_date,  # formatDate: 1 for string format (more reliable)
-            False,  # keepUpToDate
-            []  # chartOptions
-        )
-        
-        logger.info(f"Requested historical data with formatDate={format_date} (string format for compatibility)")
-        
-        # Wait for data with longer timeout and retry logic
-        max_wait_time = 15  # seconds
-        wait_interval = 1  # seconds
-        total_wait_time = 0
-        
-        while len(ib.historical_data) == 0 and total_wait_time < max_wait_time:
-            time.sleep(wait_interval)
-            total_wait_time += wait_interval
-            logger.info(f"Waiting for historical data... ({total_wait_time}/{max_wait_time}s) - bars received: {len(ib.historical_data)}")
-        
-        logger.info(f"Historical data request completed. Received {len(ib.historical_data)} bars after {total_wait_time}s")
-        if len(ib.historical_data) > 0:
-            logger.info(f"Sample bar: {ib.historical_data[0]}")
-        else:
-            logger.warning("No historical data received from IB Gateway")
-        
-        if not ib.historical_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"No historical data available for {symbol} after {total_wait_time}s timeout"
+                logger.info("Requesting historical data for %s - %s (%s mode)", symbol, data_type, account_mode)
+                logger.info("Period: %s -> %s, Timeframe: %s -> %s", period, ib_duration, timeframe, ib_timeframe)
+        
+            # Clear previous historical data for this reqId and arm the
+            # completion event before issuing the request
+            hist_req_id = 2
+            ib.historical_data.pop(hist_req_id, None)
+            hist_done = threading.Event()
+            ib.historical_data_events[hist_req_id] = hist_done
+
+            # Use string format (formatDate=1) to avoid IB Gateway conversion issues
+            # formatDate: 1 for YYYYMMDD HH:MM:SS format, 2 for Unix timestamp format
+            # Using format 1 to avoid "unconverted data remains" errors from IB Gateway
+            format_date = 1  # Force string format for compatibility
+        
+            ib.reqHistoricalData(
+                hist_req_id,
+                qualified_contract,
+                end_date_str,  # endDateTime (empty string for "now", or specific date)
+                ib_duration,  # duration
+                ib_timeframe,
+                'TRADES',
+                1,  # useRTH
+                format_date,  # formatDate: 1 for string format (more reliable)
+                False,  # keepUpToDate
+                []  # chartOptions
             )
         
-        # Process and return data with indicators
-        logger.info(f"Processing bars with indicators: {indicator_list}")
-        if has_date_range:
-            result = process_bars_with_date_range_and_indicators(ib.historical_data, symbol, timeframe, start_date, end_date, indicator_list)
+            logger.info("Requested historical data with formatDate=%s (string format for compatibility)", format_date)
+        
+            # Wait for historicalDataEnd - wakes immediately when the request
+            # completes rather than polling on a fixed interval
+            max_wait_time = 15  # seconds
+            wait_start = time.time()
+            if not hist_done.wait(timeout=max_wait_time):
+                logger.warning("Timed out waiting for historical data for %s after %ss", symbol, max_wait_time)
+            ib.historical_data_events.pop(hist_req_id, None)
+            total_wait_time = round(time.time() - wait_start, 2)
+
+            bars = ib.historical_data.pop(hist_req_id, [])
+            logger.info("Historical data request completed. Received %s bars after %ss", len(bars), total_wait_time)
+            if len(bars) > 0:
+                logger.info("Sample bar: %s", bars[0])
+            else:
+                logger.warning("No historical data received from IB Gateway")
+
+            if not bars:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"No historical data available for {symbol} after {total_wait_time}s timeout"
+                )
+
+            # Process and return data with indicators
+            logger.info("Processing bars with indicators: %s", indicator_list)
+            if has_date_range:
+                result = process_bars_with_date_range_and_indicators(bars, symbol, timeframe, start_date, end_date, indicator_list)
+            else:
+                result = process_bars_with_indicators(bars, symbol, timeframe, period, indicator_list)
+        
+            logger.info("Processed result: %s bars returned", result.count)
+        
+            # Debug: Check first few timestamps being returned to frontend
+            if result.bars and len(result.bars) > 0 and logger.isEnabledFor(logging.INFO):
+                logger.info("=== TIMESTAMP DEBUG - Values being sent to frontend ===")
+                for i, bar in enumerate(result.bars[:3]):
+                    timestamp_date = datetime.fromtimestamp(bar['timestamp'], tz=UTC)
+                    logger.info("  Bar %s: timestamp=%s, converts_to=%s", i+1, bar['timestamp'], timestamp_date)
+                    logger.info("    Validation: %s", 'VALID' if 1700000000 <= bar['timestamp'] <= 1800000000 else 'INVALID - FRONTEND WILL SHOW WRONG DATES')
+                logger.info("=== END TIMESTAMP DEBUG ===")
+
+            # Encode with orjson directly - the bars are already plain dicts,
+            # so the whole payload bypasses pydantic serialization
+            payload = vars(result).copy()
+            payload['bars'] = result.bars
+            body = orjson.dumps(payload)
+
+            # Cache the encoded bytes; evict oldest entries beyond the cap
+            if len(history_cache) >= history_cache_max_size:
+                history_cache.pop(next(iter(history_cache)))
+            history_cache[history_key] = (time.time(), body)
+
+            return body
+
+        task = history_fetch_inflight.get(history_key)
+        if task is None:
+            task = asyncio.create_task(run_tws_operation(fetch_and_encode))
+            history_fetch_inflight[history_key] = task
+            task.add_done_callback(lambda t: history_fetch_inflight.pop(history_key, None))
         else:
-            result = process_bars_with_indicators(ib.historical_data, symbol, timeframe, period, indicator_list)
-        
-        logger.info(f"Processed result: {result.count} bars returned")
-        
-        # Debug: Check first few timestamps being returned to frontend
-        if result.bars and len(result.bars) > 0:
-            logger.info("=== TIMESTAMP DEBUG - Values being sent to frontend ===")
-            for i, bar in enumerate(result.bars[:3]):
-                timestamp_date = datetime.fromtimestamp(bar.timestamp, tz=timezone.utc)
-                logger.info(f"  Bar {i+1}: timestamp={bar.timestamp}, converts_to={timestamp_date}")
-                logger.info(f"    Validation: {'VALID' if 1700000000 <= bar.timestamp <= 1800000000 else 'INVALID - FRONTEND WILL SHOW WRONG DATES'}")
-            logger.info("=== END TIMESTAMP DEBUG ===")
-        
-        return result
-        
+            logger.info("Joining in-flight history fetch for %s", history_key)
+
+        return Response(content=await task, media_type="application/json")
+
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting historical data: {e}")
+        logger.error("Error getting historical data: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get historical data: {str(e)}"
         )
 
+@app.get("/market-data/history/stream")
+async def stream_historical_data(
+    symbol: str,
+    timeframe: str,
+    period: str = "1Y",
+    account_mode: str = "paper",
+    start_date: str = None,
+    end_date: str = None,
+    indicators: str = None,
+    secType: str = "STK",
+    exchange: str = "SMART",
+    currency: str = "USD"
+):
+    """Stream historical bars as NDJSON, one bar per line
+
+    A multi-year minute chart is tens of thousands of bars; streaming
+    lets the client render the first rows while the rest are still on
+    the wire, instead of waiting for one monolithic JSON array. The
+    first line carries the response metadata (symbol, count, ...), each
+    following line is a single bar. Fetching goes through the regular
+    history handler, so the response cache and single-flight
+    coalescing apply and failures surface as normal HTTP errors before
+    any bytes are streamed.
+    """
+    response = await get_historical_data(
+        symbol, timeframe, period, account_mode,
+        start_date, end_date, indicators, secType, exchange, currency
+    )
+    payload = orjson.loads(response.body)
+    bars = payload.pop('bars', [])
+    payload['count'] = len(bars)
+
+    def generate_lines():
+        yield orjson.dumps(payload) + b"\n"
+        for bar in bars:
+            yield orjson.dumps(bar) + b"\n"
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
 # Available indicators endpoint
 @app.get("/indicators/available")
 async def get_available_indicators():
@@ -1342,7 +1998,7 @@ async def get_available_indicators():
             "usage": "Add indicators as comma-separated list in 'indicators' parameter, e.g., indicators=sma_20,rsi,bollinger"
         }
     except Exception as e:
-        logger.error(f"Error getting available indicators: {e}")
+        logger.error("Error getting available indicators: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get available indicators: {str(e)}"
@@ -1368,7 +2024,7 @@ async def get_available_strategies():
             "usage": "Use strategy key in backtest requests"
         }
     except Exception as e:
-        logger.error(f"Error getting available strategies: {e}")
+        logger.error("Error getting available strategies: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get available strategies: {str(e)}"
@@ -1396,19 +2052,7 @@ async def run_backtest(
             )
         
         # Get historical data first
-        logger.info(f"Getting historical data for backtesting: {symbol}, {timeframe}, {period}")
-        
-        # Create a temporary IB connection to get data
-        ib = get_ib_connection()
-        
-        if not verify_connection_health(ib):
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="IB Gateway connection is not available"
-            )
-        
-        # Create contract
-        qualified_contract = create_contract(symbol, 'STK', 'SMART', 'USD')
+        logger.info("Getting historical data for backtesting: %s, %s, %s", symbol, timeframe, period)
         
         # Determine date range
         has_date_range = start_date and end_date
@@ -1430,92 +2074,84 @@ async def run_backtest(
                     detail="Date range cannot exceed 365 days for backtesting"
                 )
                 
-            end_date_str = end_dt.strftime("%Y%m%d %H:%M:%S")
+            end_date_str = end_dt.strftime(IB_DATETIME_FORMAT)
             ib_duration = f"{duration_days} D"
         else:
             end_date_str = ""
             ib_duration = convert_period(period)
         
         # Convert timeframe
-        timeframe_map = {
-            'tick': '1 secs',  # Tick data - use 1 second as closest approximation
-            '1min': '1 min',
-            '5min': '5 mins',
-            '15min': '15 mins', 
-            '30min': '30 mins',
-            '1hour': '1 hour',
-            '4hour': '4 hours',
-            '8hour': '8 hours',
-            '1day': '1 day'
-        }
-        ib_timeframe = timeframe_map.get(timeframe, '1 hour')
-        
-        # Clear previous data
-        ib.historical_data = []
-        
-        # Request historical data
-        ib.reqHistoricalData(
-            3,  # reqId for backtest
-            qualified_contract,
-            end_date_str,
-            ib_duration,
-            ib_timeframe,
-            'TRADES',
-            1,  # useRTH
-            1,  # formatDate
-            False,  # keepUpToDate
-            []  # chartOptions
-        )
-        
-        # Wait for data
-        time.sleep(8)  # Longer wait for more data
-        
-        if not ib.historical_data:
+        ib_timeframe = convert_timeframe(timeframe)
+
+        # The blocking ibapi work - connection check, contract
+        # qualification, request and wait - runs on the TWS worker thread
+        # so the event loop stays free for other requests meanwhile
+        def fetch_backtest_bars():
+            ib = get_ib_connection()
+
+            if not verify_connection_health(ib):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="IB Gateway connection is not available"
+                )
+
+            qualified_contract = cached_contract(symbol, 'STK', 'SMART', 'USD')
+
+            # Clear previous data for this reqId
+            backtest_req_id = 3
+            ib.historical_data.pop(backtest_req_id, None)
+
+            # Request historical data
+            ib.reqHistoricalData(
+                backtest_req_id,
+                qualified_contract,
+                end_date_str,
+                ib_duration,
+                ib_timeframe,
+                'TRADES',
+                1,  # useRTH
+                1,  # formatDate
+                False,  # keepUpToDate
+                []  # chartOptions
+            )
+
+            # Wait for data
+            time.sleep(8)  # Longer wait for more data
+
+            return ib.historical_data.pop(backtest_req_id, [])
+
+        backtest_bars = await run_tws_operation(fetch_backtest_bars)
+        if not backtest_bars:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No historical data available for {symbol} backtesting"
             )
-        
-        logger.info(f"Retrieved {len(ib.historical_data)} bars for backtesting")
-        
-        # Convert to DataFrame
-        bars_data = []
-        for bar in ib.historical_data:
-            try:
-                # Handle different date formats from IB
-                if isinstance(bar.date, str):
-                    # String format like "20250725 23:30:00"
-                    if ' ' in bar.date:
-                        bar_datetime = datetime.strptime(bar.date, "%Y%m%d %H:%M:%S")
-                    else:
-                        # Date only format like "20250725"
-                        bar_datetime = datetime.strptime(bar.date, "%Y%m%d")
-                elif isinstance(bar.date, (int, float)):
-                    # Unix timestamp
-                    bar_datetime = datetime.fromtimestamp(bar.date)
-                else:
-                    # Assume it's already a datetime object
-                    bar_datetime = bar.date
-                
-                bars_data.append({
-                    'timestamp': int(bar_datetime.timestamp()),
-                    'open': float(bar.open),
-                    'high': float(bar.high),
-                    'low': float(bar.low),
-                    'close': float(bar.close),
-                    'volume': int(bar.volume)
-                })
-            except Exception as e:
-                logger.warning(f"Error processing bar for backtesting: {e}, bar.date={bar.date}")
-                continue
-        
-        if len(bars_data) < 50:  # Minimum data for meaningful backtest
+
+        logger.info("Retrieved %s bars for backtesting", len(backtest_bars))
+
+        # Convert to DataFrame from column arrays - dict-of-arrays
+        # construction skips the per-row dict and dtype inference that
+        # pd.DataFrame(list_of_dicts) pays for
+        timestamps, opens, highs, lows, closes, volumes, valid = bars_to_arrays(backtest_bars)
+        if not valid.all():
+            logger.warning("Dropping %s bars with unparseable dates for backtesting", int((~valid).sum()))
+            timestamps, opens, highs, lows, closes, volumes = (
+                arr[valid] for arr in (timestamps, opens, highs, lows, closes, volumes))
+
+        if len(timestamps) < 50:  # Minimum data for meaningful backtest
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Insufficient data for backtesting. Got {len(bars_data)} bars, need at least 50"
+                detail=f"Insufficient data for backtesting. Got {len(timestamps)} bars, need at least 50"
             )
-        
-        df = pd.DataFrame(bars_data)
+
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'open': opens,
+            'high': highs,
+            'low': lows,
+            'close': closes,
+            'volume': volumes,
+        }, copy=False)
         df.index = pd.to_datetime(df['timestamp'], unit='s')
         
         # Create strategy instance
@@ -1540,7 +2176,7 @@ async def run_backtest(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error running backtest: {e}")
+        logger.error("Error running backtest: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to run backtest: {str(e)}"
@@ -1552,11 +2188,11 @@ def get_realtime_data_sync(symbol: str, account_mode: str = "paper"):
         data_type = get_data_type_for_account_mode(account_mode)
         data_source = get_market_data_source(account_mode)
         
-        logger.info(f"Starting {data_type} data request for symbol: {symbol} ({account_mode} mode)")
+        logger.info("Starting %s data request for symbol: %s (%s mode)", data_type, symbol, account_mode)
         
         # Get connection
         ib = get_ib_connection()
-        logger.info(f"Using shared TWS API connection, connected: {ib.isConnected()}")
+        logger.info("Using shared TWS API connection, connected: %s", ib.isConnected())
         
         # Verify connection health before making requests
         if not verify_connection_health(ib):
@@ -1571,36 +2207,57 @@ def get_realtime_data_sync(symbol: str, account_mode: str = "paper"):
             # Request delayed data (type 3) for paper trading
             ib.reqMarketDataType(3)
             logger.info("Requesting delayed market data (type 3)")
-        
-        # Small delay to allow market data type to be set
-        time.sleep(1)
-        
-        # Create contract
-        contract = create_contract(symbol.upper())
-        logger.info(f"Created contract for {symbol}: {contract}")
-        
-        # Request contract details to qualify the contract
-        ib.reqContractDetails(3, contract)
-        time.sleep(2)
-        
-        if not ib.contracts:
-            logger.error(f"No qualified contracts found for symbol: {symbol}")
-            raise Exception(f"Symbol {symbol} not found or cannot be qualified")
-        
-        qualified_contract = ib.contracts[0]
-        logger.info(f"Using qualified contract: {qualified_contract}")
-        
-        # Request market data
-        req_id = 4
-        ib.reqMktData(req_id, qualified_contract, '', False, False, [])
-        logger.info(f"Market data requested for {qualified_contract.symbol} with data type: {data_type}")
-        
-        # Wait for data
-        time.sleep(3)
-        
-        # Get data from the client
-        tick_data = ib.data.get(req_id, {})
-        logger.info(f"Tick data received: {tick_data}")
+
+        # No settling sleep needed: the data type applies server-side and
+        # any latency overlaps the contract-details wait on first
+        # subscribe
+
+        # Serve from the long-lived subscription when one is already
+        # ticking for this symbol/mode; only a first-time (or
+        # post-reconnect) request qualifies the contract and waits for
+        # the initial price tick - repeat polls skip the gateway entirely
+        sub_key = (symbol.upper(), account_mode.lower())
+        req_id = realtime_subscriptions.get(sub_key)
+        tick_data = ib.data.get(req_id, {}) if req_id is not None else {}
+
+        if not tick_data:
+            # Check the qualified contract cache before hitting IB Gateway
+            contract_key = get_cache_key(symbol, 'STK', 'SMART', 'USD')
+            cached_qualified = contract_cache.get(contract_key)
+            if cached_qualified and (time.time() - cached_qualified[0]) < contract_cache_ttl:
+                qualified_contract = cached_qualified[1]
+                logger.info("Using cached qualified contract for %s", contract_key)
+            else:
+                contract = cached_contract(symbol.upper())
+                logger.info("Created contract for %s: %s", symbol, contract)
+
+                # Request contract details to qualify the contract, waking
+                # on contractDetailsEnd instead of a fixed sleep
+                ib.contracts = []
+                request_contract_details(ib, 3, contract)
+
+                if not ib.contracts:
+                    logger.error("No qualified contracts found for symbol: %s", symbol)
+                    raise Exception(f"Symbol {symbol} not found or cannot be qualified")
+
+                qualified_contract = ib.contracts[0]
+                contract_cache[contract_key] = (time.time(), qualified_contract)
+                logger.info("Using qualified contract: %s", qualified_contract)
+
+            if req_id is None:
+                req_id = next(realtime_req_ids)
+                realtime_subscriptions[sub_key] = req_id
+            tick_arrived = threading.Event()
+            ib.market_data_events[req_id] = tick_arrived
+            ib.reqMktData(req_id, qualified_contract, '', False, False, [])
+            logger.info("Market data subscription opened for %s with data type: %s (reqId %s)",
+                        qualified_contract.symbol, data_type, req_id)
+
+            if not tick_arrived.wait(timeout=3):
+                logger.warning("No price tick for %s within 3s, returning whatever arrived", symbol)
+            ib.market_data_events.pop(req_id, None)
+            tick_data = ib.data.get(req_id, {})
+        logger.info("Tick data received: %s", tick_data)
         
         # Process quote
         bid = tick_data.get('bid') if tick_data.get('tickType') == TickTypeEnum.BID else None
@@ -1611,7 +2268,7 @@ def get_realtime_data_sync(symbol: str, account_mode: str = "paper"):
         # If no last price, try to get it from bid/ask
         if not last and bid and ask:
             last = (float(bid) + float(ask)) / 2
-            logger.info(f"Using midpoint price: {last}")
+            logger.info("Using midpoint price: %s", last)
         
         # Process quote with better data handling
         quote = RealTimeQuote(
@@ -1620,22 +2277,21 @@ def get_realtime_data_sync(symbol: str, account_mode: str = "paper"):
             ask=float(ask) if ask and not math.isnan(float(ask)) else None,
             last=float(last) if last and not math.isnan(float(last)) else None,
             volume=int(volume) if volume and not math.isnan(float(volume)) else None,
-            timestamp=datetime.now().isoformat()
+            timestamp=_now_iso()
         )
         
-        logger.info(f"Processed quote: {quote}")
-        
-        # Cancel market data subscription to clean up
-        ib.cancelMktData(req_id)
-        logger.info("Market data subscription cancelled")
-        
+        logger.info("Processed quote: %s", quote)
+
+        # The subscription deliberately stays open: the next poll for
+        # this symbol/mode reads the latest snapshot with no wait, and
+        # disconnecting tears all subscriptions down with the socket
+
         return quote
         
     except Exception as e:
-        logger.error(f"Exception in get_realtime_data_sync: {type(e).__name__}: {str(e)}")
-        logger.error(f"Exception details: {repr(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        # One exception record carries the type, message and traceback;
+        # %s args defer formatting until the record is actually emitted
+        logger.exception("Exception in get_realtime_data_sync for %s", symbol)
         raise Exception(f"Failed to get real-time data for {symbol}: {type(e).__name__}: {str(e)}")
 
 # Tick data endpoint
@@ -1643,20 +2299,20 @@ def get_realtime_data_sync(symbol: str, account_mode: str = "paper"):
 async def get_tick_data(symbol: str, account_mode: str = "paper"):
     """Get high-frequency tick data"""
     try:
-        logger.info(f"Tick data endpoint called for symbol: {symbol}")
+        logger.info("Tick data endpoint called for symbol: %s", symbol)
         
         # Run the synchronous operation in a separate thread
         tick_data = await run_tws_operation(lambda: get_tick_data_sync(symbol, account_mode))
         
-        logger.info(f"Successfully retrieved tick data for {symbol}")
+        logger.info("Successfully retrieved tick data for %s", symbol)
         return tick_data
         
     except HTTPException as he:
-        logger.error(f"HTTP Exception in tick data endpoint: {he.detail}")
+        logger.error("HTTP Exception in tick data endpoint: %s", he.detail)
         raise he
     except Exception as e:
         error_str = str(e)
-        logger.error(f"Unexpected error in tick data endpoint: {type(e).__name__}: {error_str}")
+        logger.error("Unexpected error in tick data endpoint: %s: %s", type(e).__name__, error_str)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1670,8 +2326,8 @@ def get_tick_data_sync(symbol: str, account_mode: str = "paper"):
         ib = get_ib_connection()
         
         # Create contract
-        contract = create_contract(symbol.upper(), 'STK', 'SMART', 'USD')
-        
+        contract = cached_contract(symbol.upper(), 'STK', 'SMART', 'USD')
+
         # Clear previous contracts
         ib.contracts = []
         
@@ -1680,28 +2336,28 @@ def get_tick_data_sync(symbol: str, account_mode: str = "paper"):
         time.sleep(2)
         
         if not ib.contracts:
-            logger.error(f"No qualified contracts found for symbol: {symbol}")
+            logger.error("No qualified contracts found for symbol: %s", symbol)
             raise Exception(f"Symbol {symbol} not found or cannot be qualified")
         
         qualified_contract = ib.contracts[0]
-        logger.info(f"Using qualified contract for tick data: {qualified_contract}")
+        logger.info("Using qualified contract for tick data: %s", qualified_contract)
         
         # Request tick data
         req_id = 7
         ib.reqMktData(req_id, qualified_contract, '', False, False, [])
-        logger.info(f"Tick data requested for {qualified_contract.symbol}")
+        logger.info("Tick data requested for %s", qualified_contract.symbol)
         
         # Wait for data
         time.sleep(5)  # Longer wait for tick data
         
         # Get data from the client
         tick_data = ib.data.get(req_id, {})
-        logger.info(f"Tick data received: {tick_data}")
+        logger.info("Tick data received: %s", tick_data)
         
         # Process tick data
         tick_info = {
             "symbol": symbol.upper(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "bid": tick_data.get('bid'),
             "ask": tick_data.get('ask'),
             "last": tick_data.get('last'),
@@ -1722,211 +2378,355 @@ def get_tick_data_sync(symbol: str, account_mode: str = "paper"):
         return tick_info
         
     except Exception as e:
-        logger.error(f"Exception in get_tick_data_sync: {type(e).__name__}: {str(e)}")
-        logger.error(f"Exception details: {repr(e)}")
+        logger.error("Exception in get_tick_data_sync: %s: %s", type(e).__name__, str(e))
+        logger.error("Exception details: %s", repr(e))
         import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.error("Traceback: %s", traceback.format_exc())
         raise Exception(f"Failed to get tick data for {symbol}: {type(e).__name__}: {str(e)}")
 
 # Real-time data endpoint
+# Classifies realtime-data failures in a single scan of the message
+# instead of four lowered-substring passes; named groups identify which
+# category matched
+REALTIME_ERROR_PATTERN = re.compile(
+    r"(?P<subscription>subscription|market data farm)"
+    r"|(?P<timeout>timeout)"
+    r"|(?P<not_found>not found|qualify)",
+    re.IGNORECASE
+)
+
 @app.get("/market-data/realtime", response_model=RealTimeQuote)
 async def get_realtime_data(symbol: str, account_mode: str = "paper"):
     """Get real-time market data"""
     try:
-        logger.info(f"Real-time data endpoint called for symbol: {symbol}")
+        logger.info("Real-time data endpoint called for symbol: %s", symbol)
         
         # Run the synchronous operation in a separate thread
         quote = await run_tws_operation(lambda: get_realtime_data_sync(symbol, account_mode))
         
-        logger.info(f"Successfully retrieved market data for {symbol}")
+        logger.info("Successfully retrieved market data for %s", symbol)
         return quote
         
     except HTTPException as he:
-        logger.error(f"HTTP Exception in endpoint: {he.detail}")
+        logger.error("HTTP Exception in endpoint: %s", he.detail)
         raise he
     except Exception as e:
         error_str = str(e)
-        logger.error(f"Unexpected error in real-time data endpoint: {type(e).__name__}: {error_str}")
+        logger.error("Unexpected error in real-time data endpoint: %s: %s", type(e).__name__, error_str)
         
         # Handle specific IB Gateway subscription errors
-        if "subscription" in error_str.lower() or "market data farm" in error_str.lower():
+        match = REALTIME_ERROR_PATTERN.search(error_str)
+        error_kind = match.lastgroup if match else None
+        if error_kind == 'subscription':
             error_message = f"Market data subscription issue for {symbol}. Using delayed data if available. Check IB Gateway market data subscriptions."
-        elif "timeout" in error_str.lower():
+        elif error_kind == 'timeout':
             error_message = f"Timeout retrieving market data for {symbol}. IB Gateway may be busy or unresponsive."
-        elif "not found" in error_str.lower() or "qualify" in error_str.lower():
+        elif error_kind == 'not_found':
             error_message = f"Symbol {symbol} not found or cannot be qualified by IB Gateway."
         else:
             error_message = f"Failed to get market data for {symbol}: {error_str}"
         
-        logger.error(f"Error details: {error_message}")
+        logger.error("Error details: %s", error_message)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=error_message
         )
 
+# Exchange preference for contract search ordering - module level so the
+# sort key doesn't rebuild the dict on every comparison
+EXCHANGE_PRIORITY = {
+    'SMART': 0,
+    'NYSE': 1,
+    'NASDAQ': 2,
+    'AMEX': 3
+}
+
+def contract_sort_key(result):
+    """Sort key for search results: preferred exchanges first, then symbol"""
+    return (EXCHANGE_PRIORITY.get(result['exchange'], 999), result['symbol'])
+
+def paginate_results(results: List[Dict], limit: int, cursor: Optional[str]):
+    """Slice one page out of a sorted result list
+
+    The cursor is the conid of the last row of the previous page, so
+    clients resume where they left off; returns (page, next_cursor)
+    where next_cursor is None once the list is exhausted.
+    """
+    start = 0
+    if cursor:
+        for i, result in enumerate(results):
+            if result['conid'] == cursor:
+                start = i + 1
+                break
+    page = results[start:start + limit]
+    next_cursor = page[-1]['conid'] if page and (start + len(page)) < len(results) else None
+    return page, next_cursor
+
+def build_contract_result(contract, include_description: bool = False) -> Dict:
+    """Format a qualified contract as a search-result dict
+
+    Optional fields are pulled from the instance __dict__ in one pass -
+    a bound dict .get per field is far cheaper than a getattr call for
+    each, which adds up when option chains return hundreds of rows.
+    The display description duplicates symbol+companyName, so it is only
+    formatted when a caller opts in.
+    """
+    get = vars(contract).get
+    company_name = get('longName', '') or contract.symbol
+    result = {
+        "conid": str(contract.conId),
+        "symbol": contract.symbol,
+        "companyName": company_name,
+        "description": f"{contract.symbol} - {company_name}" if include_description else None,
+        "secType": contract.secType,
+        "exchange": contract.exchange,
+        "currency": contract.currency,
+        "primaryExchange": get('primaryExchange', ''),
+        "localSymbol": get('localSymbol', ''),
+        "tradingClass": get('tradingClass', ''),
+        "multiplier": get('multiplier', ''),
+        "strike": get('strike', ''),
+        "right": get('right', ''),
+        "expiry": get('expiry', ''),
+        "includeExpired": get('includeExpired', False),
+        "comboLegsDescrip": get('comboLegsDescrip', ''),
+        "contractMonth": get('contractMonth', ''),
+        "industry": get('industry', ''),
+        "category": get('category', ''),
+        "subcategory": get('subcategory', ''),
+        "timeZoneId": get('timeZoneId', ''),
+        "tradingHours": get('tradingHours', ''),
+        "liquidHours": get('liquidHours', ''),
+        "evRule": get('evRule', ''),
+        "evMultiplier": get('evMultiplier', ''),
+        "secIdList": get('secIdList', []),
+        "aggGroup": get('aggGroup', ''),
+        "underSymbol": get('underSymbol', ''),
+        "underSecType": get('underSecType', ''),
+        "marketRuleIds": get('marketRuleIds', ''),
+        "realExpirationDate": get('realExpirationDate', ''),
+        "lastTradingDay": get('lastTradingDay', ''),
+        "stockType": get('stockType', ''),
+        "minSize": get('minSize', ''),
+        "sizeIncrement": get('sizeIncrement', ''),
+        "suggestedSizeIncrement": get('suggestedSizeIncrement', ''),
+        "sections": []
+    }
+    sections = get('sections')
+    if sections:
+        result["sections"] = [build_section_result(section) for section in sections]
+    return result
+
+# Field table for section rows: one definition drives the extraction
+# loop below, so per-section cost is a single C-level dict iteration
+# instead of 30 hand-written lookups
+SECTION_FIELD_DEFAULTS = {
+    "exchange": '',
+    "secType": '',
+    "expiry": '',
+    "strike": '',
+    "right": '',
+    "multiplier": '',
+    "tradingClass": '',
+    "localSymbol": '',
+    "includeExpired": False,
+    "comboLegsDescrip": '',
+    "contractMonth": '',
+    "industry": '',
+    "category": '',
+    "subcategory": '',
+    "timeZoneId": '',
+    "tradingHours": '',
+    "liquidHours": '',
+    "evRule": '',
+    "evMultiplier": '',
+    "secIdList": (),
+    "aggGroup": '',
+    "underSymbol": '',
+    "underSecType": '',
+    "marketRuleIds": '',
+    "realExpirationDate": '',
+    "lastTradingDay": '',
+    "stockType": '',
+    "minSize": '',
+    "sizeIncrement": '',
+    "suggestedSizeIncrement": ''
+}
+
+def build_section_result(section) -> Dict:
+    """Format a multi-exchange contract section as a result dict"""
+    attrs = vars(section)
+    get = attrs.get
+    return {field: get(field, default) for field, default in SECTION_FIELD_DEFAULTS.items()}
+
+def build_search_response(request: SearchRequest, results: List[Dict]) -> Dict:
+    """Assemble one page of /contract/search results"""
+    page, next_cursor = paginate_results(results, request.limit, request.cursor)
+    return {
+        "results": page,
+        "count": len(page),
+        "total_count": len(results),
+        "next_cursor": next_cursor,
+        "search_params": {
+            "symbol": request.symbol,
+            "secType": request.secType,
+            "exchange": request.exchange,
+            "currency": request.currency,
+            "searchByName": request.name
+        },
+        "timestamp": _now_iso()
+    }
+
+def build_advanced_search_response(request: AdvancedSearchRequest, results: List[Dict]) -> Dict:
+    """Assemble one page of /contract/advanced-search results"""
+    page, next_cursor = paginate_results(results, request.limit, request.cursor)
+    return {
+        "results": page,
+        "count": len(page),
+        "total_count": len(results),
+        "next_cursor": next_cursor,
+        "search_params": {
+            "symbol": request.symbol,
+            "secType": request.secType,
+            "exchange": request.exchange,
+            "currency": request.currency,
+            "expiry": request.expiry,
+            "strike": request.strike,
+            "right": request.right,
+            "multiplier": request.multiplier,
+            "includeExpired": request.includeExpired,
+            "searchByName": request.name
+        },
+        "timestamp": _now_iso()
+    }
+
+def cached_json_response(payload, http_request: Request, max_age: int, public: bool = True) -> Response:
+    """Serialize a response with revalidation headers
+
+    The ETag is a short hash of the exact bytes on the wire, so browsers
+    and CDNs can revalidate with If-None-Match and get a bodyless 304
+    when nothing changed - repeated identical searches then cost zero
+    JSON and zero TWS traffic.
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{'public' if public else 'private'}, max-age={max_age}"
+    }
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # Contract search endpoint
-@app.post("/contract/search")
-async def search_contracts(request: SearchRequest):
-    """Enhanced search for contracts with better filtering and results"""
+def search_contracts_sync(request: SearchRequest):
+    """Enhanced contract search - blocking body, runs on a search worker"""
     try:
         # Log the account mode being used
         data_type = get_data_type_for_account_mode(request.account_mode)
-        logger.info(f"Searching contracts for {request.symbol} ({request.secType}) in {request.account_mode} mode - {data_type} data")
-        
-        # Get connection
-        ib = get_ib_connection()
-        
+        logger.info("Searching contracts for %s (%s) in %s mode - %s data", request.symbol, request.secType, request.account_mode, data_type)
+
+        # Serve repeated searches from cache - contract metadata barely
+        # changes intraday, so a hit skips the IB round-trip entirely.
+        # Pagination fields stay out of the key so every page of a search
+        # shares one cached result list
+        search_key = ('search',) + tuple(sorted(request.model_dump(exclude={'limit', 'cursor'}).items()))
+        results = get_cached_search(search_key)
+        if results is not None:
+            logger.info("Serving cached contract search for %s", request.symbol)
+            return build_search_response(request, results)
+
         # Create contract with enhanced parameters
-        contract = create_contract(request.symbol.upper(), request.secType, request.exchange, request.currency)
-        
-        # Clear previous contracts
-        ib.contracts = []
-        
-        # Request contract details with longer timeout for better results
-        ib.reqContractDetails(5, contract)
-        time.sleep(3)  # Increased wait time for more comprehensive results
-        
-        if not ib.contracts:
+        contract = cached_contract(request.symbol.upper(), request.secType, request.exchange, request.currency)
+
+        # Check out a pooled client so concurrent searches each get their
+        # own session and wrapper state
+        with ib_pool.acquire() as ib:
+            # Clear previous contracts
+            ib.contracts = []
+
+            # Request contract details, waking on contractDetailsEnd instead
+            # of paying a fixed 3s wait
+            request_contract_details(ib, 5, contract)
+            contracts = ib.contracts
+
+        if not contracts:
             return {"results": [], "count": 0}
-        
+
         # Enhanced results formatting with more details
-        results = []
-        for contract in ib.contracts:
-            # Extract company name from description or symbol
-            company_name = getattr(contract, 'longName', '') or contract.symbol
-            
-            # Create enhanced result object
-            result = {
-                "conid": str(contract.conId),
-                "symbol": contract.symbol,
-                "companyName": company_name,
-                "description": f"{contract.symbol} - {company_name}",
-                "secType": contract.secType,
-                "exchange": contract.exchange,
-                "currency": contract.currency,
-                "primaryExchange": getattr(contract, 'primaryExchange', ''),
-                "localSymbol": getattr(contract, 'localSymbol', ''),
-                "tradingClass": getattr(contract, 'tradingClass', ''),
-                "multiplier": getattr(contract, 'multiplier', ''),
-                "strike": getattr(contract, 'strike', ''),
-                "right": getattr(contract, 'right', ''),
-                "expiry": getattr(contract, 'expiry', ''),
-                "includeExpired": getattr(contract, 'includeExpired', False),
-                "comboLegsDescrip": getattr(contract, 'comboLegsDescrip', ''),
-                "contractMonth": getattr(contract, 'contractMonth', ''),
-                "industry": getattr(contract, 'industry', ''),
-                "category": getattr(contract, 'category', ''),
-                "subcategory": getattr(contract, 'subcategory', ''),
-                "timeZoneId": getattr(contract, 'timeZoneId', ''),
-                "tradingHours": getattr(contract, 'tradingHours', ''),
-                "liquidHours": getattr(contract, 'liquidHours', ''),
-                "evRule": getattr(contract, 'evRule', ''),
-                "evMultiplier": getattr(contract, 'evMultiplier', ''),
-                "secIdList": getattr(contract, 'secIdList', []),
-                "aggGroup": getattr(contract, 'aggGroup', ''),
-                "underSymbol": getattr(contract, 'underSymbol', ''),
-                "underSecType": getattr(contract, 'underSecType', ''),
-                "marketRuleIds": getattr(contract, 'marketRuleIds', ''),
-                "realExpirationDate": getattr(contract, 'realExpirationDate', ''),
-                "lastTradingDay": getattr(contract, 'lastTradingDay', ''),
-                "stockType": getattr(contract, 'stockType', ''),
-                "minSize": getattr(contract, 'minSize', ''),
-                "sizeIncrement": getattr(contract, 'sizeIncrement', ''),
-                "suggestedSizeIncrement": getattr(contract, 'suggestedSizeIncrement', ''),
-                "sections": []
-            }
-            
-            # Add sections for multi-exchange contracts
-            if hasattr(contract, 'sections') and contract.sections:
-                for section in contract.sections:
-                    result["sections"].append({
-                        "exchange": section.exchange,
-                        "secType": section.secType,
-                        "expiry": section.expiry,
-                        "strike": section.strike,
-                        "right": section.right,
-                        "multiplier": section.multiplier,
-                        "tradingClass": section.tradingClass,
-                        "localSymbol": section.localSymbol,
-                        "includeExpired": section.includeExpired,
-                        "comboLegsDescrip": section.comboLegsDescrip,
-                        "contractMonth": section.contractMonth,
-                        "industry": section.industry,
-                        "category": section.category,
-                        "subcategory": section.subcategory,
-                        "timeZoneId": section.timeZoneId,
-                        "tradingHours": section.tradingHours,
-                        "liquidHours": section.liquidHours,
-                        "evRule": section.evRule,
-                        "evMultiplier": section.evMultiplier,
-                        "secIdList": section.secIdList,
-                        "aggGroup": section.aggGroup,
-                        "underSymbol": section.underSymbol,
-                        "underSecType": section.underSecType,
-                        "marketRuleIds": section.marketRuleIds,
-                        "realExpirationDate": section.realExpirationDate,
-                        "lastTradingDay": section.lastTradingDay,
-                        "stockType": section.stockType,
-                        "minSize": section.minSize,
-                        "sizeIncrement": section.sizeIncrement,
-                        "suggestedSizeIncrement": section.suggestedSizeIncrement
-                    })
-            
-            results.append(result)
-        
+        results = [build_contract_result(contract, request.include_description) for contract in contracts]
+
         # Sort results by relevance (stocks first, then by exchange preference)
-        def sort_key(result):
-            # Priority: SMART exchange first, then primary exchanges
-            exchange_priority = {
-                'SMART': 0,
-                'NYSE': 1,
-                'NASDAQ': 2,
-                'AMEX': 3
-            }
-            return (
-                exchange_priority.get(result['exchange'], 999),
-                result['symbol']
-            )
-        
-        results.sort(key=sort_key)
-        
-        return {
-            "results": results,
-            "count": len(results),
-            "search_params": {
-                "symbol": request.symbol,
-                "secType": request.secType,
-                "exchange": request.exchange,
-                "currency": request.currency,
-                "searchByName": request.name
-            },
-            "timestamp": datetime.now().isoformat()
-        }
+        results.sort(key=contract_sort_key)
+
+        cache_search_result(search_key, results)
+        return build_search_response(request, results)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error searching contracts: {e}")
+        logger.error("Error searching contracts: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to search contracts: {str(e)}"
         )
 
-@app.post("/contract/advanced-search")
-async def advanced_search_contracts(request: AdvancedSearchRequest):
-    """Advanced search for contracts with additional filters"""
+@app.post("/contract/search")
+async def search_contracts(request: SearchRequest, http_request: Request):
+    """Enhanced search for contracts with better filtering and results"""
+    # The IB-bound body blocks on completion events, so it runs on a
+    # search worker against the client pool instead of stalling the
+    # event loop or queueing behind the primary connection
+    result = await run_search_operation(lambda: search_contracts_sync(request))
+    # Contract metadata barely changes intraday, so let clients cache it
+    return cached_json_response(result, http_request, max_age=3600)
+
+@app.post("/contract/search/stream")
+async def search_contracts_stream(request: SearchRequest):
+    """Stream search results as NDJSON, one contract per line
+
+    For large option-chain queries this puts the first row on the wire
+    as soon as it is built and lets each row dict be collected after its
+    yield, instead of materializing, sorting and encoding the whole
+    result list first. Rows arrive unsorted and unpaginated - clients
+    that want ordering or pages should use /contract/search.
+    """
+    def fetch_contracts():
+        contract = cached_contract(request.symbol.upper(), request.secType, request.exchange, request.currency)
+        with ib_pool.acquire() as ib:
+            ib.contracts = []
+            request_contract_details(ib, 5, contract)
+            return ib.contracts
+
+    # The TWS round-trip completes before streaming starts, so failures
+    # still surface as normal HTTP errors rather than a truncated body
+    contracts = await run_search_operation(fetch_contracts)
+
+    def generate_rows():
+        for contract in contracts:
+            yield orjson.dumps(build_contract_result(contract, request.include_description)) + b"\n"
+
+    return StreamingResponse(generate_rows(), media_type="application/x-ndjson")
+
+def advanced_search_contracts_sync(request: AdvancedSearchRequest):
+    """Advanced contract search - blocking body, runs on a search worker"""
     try:
         # Log the account mode being used
         data_type = get_data_type_for_account_mode(request.account_mode)
-        logger.info(f"Advanced search for {request.symbol or 'ALL'} ({request.secType}) in {request.account_mode} mode - {data_type} data")
-        
-        # Get connection
-        ib = get_ib_connection()
-        
+        logger.info("Advanced search for %s (%s) in %s mode - %s data", request.symbol or 'ALL', request.secType, request.account_mode, data_type)
+
+        # Serve repeated searches from cache; pagination fields stay out
+        # of the key so every page shares one cached result list
+        search_key = ('advanced',) + tuple(sorted(request.model_dump(exclude={'limit', 'cursor'}).items()))
+        results = get_cached_search(search_key)
+        if results is not None:
+            logger.info("Serving cached advanced search for %s", request.symbol or 'ALL')
+            return build_advanced_search_response(request, results)
+
         # Create contract with advanced parameters
         contract = create_contract(request.symbol.upper() if request.symbol else "", request.secType, request.exchange, request.currency)
-        
+
         # Apply advanced filters
         if request.expiry:
             contract.expiry = request.expiry
@@ -1938,20 +2738,23 @@ async def advanced_search_contracts(request: AdvancedSearchRequest):
             contract.multiplier = request.multiplier
         if request.includeExpired:
             contract.includeExpired = request.includeExpired
-        
-        # Clear previous contracts
-        ib.contracts = []
-        
-        # Request contract details
-        ib.reqContractDetails(6, contract)
-        time.sleep(3)
-        
-        if not ib.contracts:
+
+        # Check out a pooled client so concurrent searches each get their
+        # own session and wrapper state
+        with ib_pool.acquire() as ib:
+            # Clear previous contracts
+            ib.contracts = []
+
+            # Request contract details, waking on contractDetailsEnd
+            request_contract_details(ib, 6, contract)
+            contracts = ib.contracts
+
+        if not contracts:
             return {"results": [], "count": 0}
-        
+
         # Filter and format results
         results = []
-        for contract in ib.contracts:
+        for contract in contracts:
             # Apply additional client-side filtering
             if request.expiry and hasattr(contract, 'expiry') and contract.expiry != request.expiry:
                 continue
@@ -1962,129 +2765,29 @@ async def advanced_search_contracts(request: AdvancedSearchRequest):
             if request.multiplier and hasattr(contract, 'multiplier') and contract.multiplier != request.multiplier:
                 continue
             
-            # Extract company name
-            company_name = getattr(contract, 'longName', '') or contract.symbol
-            
-            result = {
-                "conid": str(contract.conId),
-                "symbol": contract.symbol,
-                "companyName": company_name,
-                "description": f"{contract.symbol} - {company_name}",
-                "secType": contract.secType,
-                "exchange": contract.exchange,
-                "currency": contract.currency,
-                "primaryExchange": getattr(contract, 'primaryExchange', ''),
-                "localSymbol": getattr(contract, 'localSymbol', ''),
-                "tradingClass": getattr(contract, 'tradingClass', ''),
-                "multiplier": getattr(contract, 'multiplier', ''),
-                "strike": getattr(contract, 'strike', ''),
-                "right": getattr(contract, 'right', ''),
-                "expiry": getattr(contract, 'expiry', ''),
-                "includeExpired": getattr(contract, 'includeExpired', False),
-                "comboLegsDescrip": getattr(contract, 'comboLegsDescrip', ''),
-                "contractMonth": getattr(contract, 'contractMonth', ''),
-                "industry": getattr(contract, 'industry', ''),
-                "category": getattr(contract, 'category', ''),
-                "subcategory": getattr(contract, 'subcategory', ''),
-                "timeZoneId": getattr(contract, 'timeZoneId', ''),
-                "tradingHours": getattr(contract, 'tradingHours', ''),
-                "liquidHours": getattr(contract, 'liquidHours', ''),
-                "evRule": getattr(contract, 'evRule', ''),
-                "evMultiplier": getattr(contract, 'evMultiplier', ''),
-                "secIdList": getattr(contract, 'secIdList', []),
-                "aggGroup": getattr(contract, 'aggGroup', ''),
-                "underSymbol": getattr(contract, 'underSymbol', ''),
-                "underSecType": getattr(contract, 'underSecType', ''),
-                "marketRuleIds": getattr(contract, 'marketRuleIds', ''),
-                "realExpirationDate": getattr(contract, 'realExpirationDate', ''),
-                "lastTradingDay": getattr(contract, 'lastTradingDay', ''),
-                "stockType": getattr(contract, 'stockType', ''),
-                "minSize": getattr(contract, 'minSize', ''),
-                "sizeIncrement": getattr(contract, 'sizeIncrement', ''),
-                "suggestedSizeIncrement": getattr(contract, 'suggestedSizeIncrement', ''),
-                "sections": []
-            }
-            
-            # Add sections for multi-exchange contracts
-            if hasattr(contract, 'sections') and contract.sections:
-                for section in contract.sections:
-                    result["sections"].append({
-                        "exchange": section.exchange,
-                        "secType": section.secType,
-                        "expiry": section.expiry,
-                        "strike": section.strike,
-                        "right": section.right,
-                        "multiplier": section.multiplier,
-                        "tradingClass": section.tradingClass,
-                        "localSymbol": section.localSymbol,
-                        "includeExpired": section.includeExpired,
-                        "comboLegsDescrip": section.comboLegsDescrip,
-                        "contractMonth": section.contractMonth,
-                        "industry": section.industry,
-                        "category": section.category,
-                        "subcategory": section.subcategory,
-                        "timeZoneId": section.timeZoneId,
-                        "tradingHours": section.tradingHours,
-                        "liquidHours": section.liquidHours,
-                        "evRule": section.evRule,
-                        "evMultiplier": section.evMultiplier,
-                        "secIdList": section.secIdList,
-                        "aggGroup": section.aggGroup,
-                        "underSymbol": section.underSymbol,
-                        "underSecType": section.underSecType,
-                        "marketRuleIds": section.marketRuleIds,
-                        "realExpirationDate": section.realExpirationDate,
-                        "lastTradingDay": section.lastTradingDay,
-                        "stockType": section.stockType,
-                        "minSize": section.minSize,
-                        "sizeIncrement": section.sizeIncrement,
-                        "suggestedSizeIncrement": section.suggestedSizeIncrement
-                    })
-            
-            results.append(result)
-        
+            results.append(build_contract_result(contract, request.include_description))
+
         # Sort results
-        def sort_key(result):
-            exchange_priority = {
-                'SMART': 0,
-                'NYSE': 1,
-                'NASDAQ': 2,
-                'AMEX': 3
-            }
-            return (
-                exchange_priority.get(result['exchange'], 999),
-                result['symbol']
-            )
-        
-        results.sort(key=sort_key)
-        
-        return {
-            "results": results,
-            "count": len(results),
-            "search_params": {
-                "symbol": request.symbol,
-                "secType": request.secType,
-                "exchange": request.exchange,
-                "currency": request.currency,
-                "expiry": request.expiry,
-                "strike": request.strike,
-                "right": request.right,
-                "multiplier": request.multiplier,
-                "includeExpired": request.includeExpired,
-                "searchByName": request.name
-            },
-            "timestamp": datetime.now().isoformat()
-        }
-        
+        results.sort(key=contract_sort_key)
+
+        cache_search_result(search_key, results)
+        return build_advanced_search_response(request, results)
+
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in advanced contract search: {e}")
+        logger.error("Error in advanced contract search: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to perform advanced contract search: {str(e)}"
         )
 
+@app.post("/contract/advanced-search")
+async def advanced_search_contracts(request: AdvancedSearchRequest, http_request: Request):
+    """Advanced search for contracts with additional filters"""
+    result = await run_search_operation(lambda: advanced_search_contracts_sync(request))
+    return cached_json_response(result, http_request, max_age=3600)
+
 # Account service functions
 def get_account_summary_sync():
     """Get account summary information using TWS API"""
@@ -2099,39 +2802,49 @@ def get_account_summary_sync():
         
         # Get managed accounts
         if not ib.managed_accounts:
-            # Request managed accounts
-            ib.reqManagedAccts()
-            time.sleep(2)
+            # Request managed accounts, waking on the managedAccounts callback
+            accounts_received = threading.Event()
+            ib.managed_accounts_event = accounts_received
+            try:
+                ib.reqManagedAccts()
+                accounts_received.wait(timeout=3)
+            finally:
+                ib.managed_accounts_event = None
         
         if not ib.managed_accounts:
             raise Exception("No managed accounts found")
         
         account_id = ib.managed_accounts[0]
-        logger.info(f"Using account: {account_id}")
+        logger.info("Using account: %s", account_id)
         
         # Clear previous account data
         ib.account_summary = {}
         
-        # Request account summary
+        # Request account summary, waking on accountSummaryEnd
         account_tags = ['NetLiquidation', 'AccountCode', 'Currency']
-        ib.reqAccountSummary(6, 'All', ','.join(account_tags))
-        time.sleep(3)
+        summary_done = threading.Event()
+        ib.account_summary_events[6] = summary_done
+        try:
+            ib.reqAccountSummary(6, 'All', ','.join(account_tags))
+            wait_tws_event(summary_done, 5, "account summary")
+        finally:
+            ib.account_summary_events.pop(6, None)
         
         # Process account summary
         account_data = ib.account_summary.get(account_id, {})
         currency = account_data.get('Currency', 'USD')
         
-        logger.info(f"Retrieved account summary: {account_data}")
+        logger.info("Retrieved account summary: %s", account_data)
         
         return AccountSummary(
             account_id=account_id,
             currency=currency,
-            last_updated=datetime.now().isoformat(),
+            last_updated=_now_iso(),
             net_liquidation=float(account_data.get('NetLiquidation', 0)) if account_data.get('NetLiquidation') else None
         )
         
     except Exception as e:
-        logger.error(f"Error getting account summary: {e}")
+        logger.error("Error getting account summary: %s", e)
         raise Exception(f"Failed to get account summary: {str(e)}")
 
 def get_positions_sync():
@@ -2148,28 +2861,21 @@ def get_positions_sync():
         # Clear previous positions
         ib.positions = []
         
-        # Request positions
-        ib.reqPositions()
-        time.sleep(3)
-        
-        position_list = []
-        for pos in ib.positions:
-            if pos['position'] != 0:  # Only include non-zero positions
-                position_list.append(Position(
-                    symbol=pos['contract'].symbol,
-                    position=pos['position'],
-                    market_price=None,  # TWS API doesn't provide this in position data
-                    market_value=None,  # TWS API doesn't provide this in position data
-                    average_cost=float(pos['avgCost']) if pos['avgCost'] and not math.isnan(float(pos['avgCost'])) else None,
-                    unrealized_pnl=None,  # TWS API doesn't provide this in position data
-                    currency=pos['contract'].currency
-                ))
-        
-        logger.info(f"Retrieved {len(position_list)} positions")
+        # Request positions, waking on positionEnd
+        positions_done = threading.Event()
+        ib.position_end_event = positions_done
+        try:
+            ib.reqPositions()
+            wait_tws_event(positions_done, 5, "positions")
+        finally:
+            ib.position_end_event = None
+        
+        position_list = build_position_list(ib)
+        logger.info("Retrieved %s positions", len(position_list))
         return position_list
         
     except Exception as e:
-        logger.error(f"Error getting positions: {e}")
+        logger.error("Error getting positions: %s", e)
         raise Exception(f"Failed to get positions: {str(e)}")
 
 def get_orders_sync():
@@ -2186,47 +2892,195 @@ def get_orders_sync():
         # Clear previous orders
         ib.orders = []
         
-        # Request all open orders
-        ib.reqAllOpenOrders()
-        time.sleep(3)
-        
-        order_list = []
-        for order_data in ib.orders:
-            order_list.append(Order(
-                order_id=order_data['orderId'],
-                symbol=order_data['contract'].symbol,
-                action=order_data['order'].action,
-                quantity=order_data['order'].totalQuantity,
-                order_type=order_data['order'].orderType,
-                status=order_data['orderState'].status,
-                filled_quantity=None,  # TWS API doesn't provide this in open orders
-                remaining_quantity=None,  # TWS API doesn't provide this in open orders
-                avg_fill_price=None  # TWS API doesn't provide this in open orders
-            ))
+        # Request all open orders, waking on openOrderEnd
+        orders_done = threading.Event()
+        ib.open_order_end_event = orders_done
+        try:
+            ib.reqAllOpenOrders()
+            wait_tws_event(orders_done, 5, "open orders")
+        finally:
+            ib.open_order_end_event = None
         
-        logger.info(f"Retrieved {len(order_list)} orders")
+        order_list = build_order_list(ib)
+        logger.info("Retrieved %s orders", len(order_list))
         return order_list
         
     except Exception as e:
-        logger.error(f"Error getting orders: {e}")
+        logger.error("Error getting orders: %s", e)
         raise Exception(f"Failed to get orders: {str(e)}")
 
+# Multi-attribute extractors built once at import: one C-level call per
+# wrapper object instead of several interpreted attribute loads per row
+POSITION_CONTRACT_FIELDS = attrgetter('symbol', 'currency')
+ORDER_FIELDS = attrgetter('action', 'totalQuantity', 'orderType')
+
+def build_position_list(ib) -> List[Position]:
+    """Convert collected wrapper positions into Position models
+
+    Values come straight from the TWS wrapper, so model_construct skips
+    pydantic validation per row - noticeable on accounts with hundreds
+    of positions.
+    """
+    position_list = []
+    for pos in ib.positions:
+        if pos['position'] != 0:  # Only include non-zero positions
+            avg_cost = pos['avgCost']
+            avg_cost = float(avg_cost) if avg_cost and avg_cost == avg_cost else None  # NaN != NaN
+            symbol, currency = POSITION_CONTRACT_FIELDS(pos['contract'])
+            position_list.append(Position.model_construct(
+                symbol=symbol,
+                position=pos['position'],
+                market_price=None,  # TWS API doesn't provide this in position data
+                market_value=None,  # TWS API doesn't provide this in position data
+                average_cost=avg_cost,
+                unrealized_pnl=None,  # TWS API doesn't provide this in position data
+                currency=currency
+            ))
+    return position_list
+
+def build_order_list(ib) -> List[Order]:
+    """Convert collected wrapper orders into Order models (unvalidated)"""
+    order_list = []
+    for order_data in ib.orders:
+        action, quantity, order_type = ORDER_FIELDS(order_data['order'])
+        order_list.append(Order.model_construct(
+            order_id=order_data['orderId'],
+            symbol=order_data['contract'].symbol,
+            action=action,
+            quantity=quantity,
+            order_type=order_type,
+            status=order_data['orderState'].status,
+            filled_quantity=None,  # TWS API doesn't provide this in open orders
+            remaining_quantity=None,  # TWS API doesn't provide this in open orders
+            avg_fill_price=None  # TWS API doesn't provide this in open orders
+        ))
+    return order_list
+
+def get_all_account_data_sync() -> AccountData:
+    """Fetch summary, positions and orders with overlapped TWS requests
+
+    The three requests use distinct reqIds and independent wrapper
+    state, so they are issued back-to-back on the one socket and their
+    completion events awaited together - total latency is the slowest
+    call instead of the sum of all three.
+    """
+    ib = get_ib_connection()
+
+    if not verify_connection_health(ib):
+        raise Exception("TWS API connection is not healthy - reconnection required")
+
+    logger.info("Getting all account data with overlapped TWS requests")
+
+    # Managed accounts are required for the summary lookup
+    if not ib.managed_accounts:
+        accounts_received = threading.Event()
+        ib.managed_accounts_event = accounts_received
+        try:
+            ib.reqManagedAccts()
+            accounts_received.wait(timeout=3)
+        finally:
+            ib.managed_accounts_event = None
+
+    if not ib.managed_accounts:
+        raise Exception("No managed accounts found")
+
+    account_id = ib.managed_accounts[0]
+
+    # Clear state and arm all completion events before issuing anything
+    ib.account_summary = {}
+    ib.positions = []
+    ib.orders = []
+    summary_done = threading.Event()
+    positions_done = threading.Event()
+    orders_done = threading.Event()
+    ib.account_summary_events[6] = summary_done
+    ib.position_end_event = positions_done
+    ib.open_order_end_event = orders_done
+    try:
+        account_tags = ['NetLiquidation', 'AccountCode', 'Currency']
+        ib.reqAccountSummary(6, 'All', ','.join(account_tags))
+        ib.reqPositions()
+        ib.reqAllOpenOrders()
+
+        # Shared deadline across the three waits
+        deadline = time.time() + 5
+        for name, event in (('account summary', summary_done),
+                            ('positions', positions_done),
+                            ('open orders', orders_done)):
+            wait_tws_event(event, max(0.0, deadline - time.time()), name)
+    finally:
+        ib.account_summary_events.pop(6, None)
+        ib.position_end_event = None
+        ib.open_order_end_event = None
+
+    # One timestamp for the whole response so nested structures agree
+    # on when the snapshot was taken
+    now_iso = _now_iso()
+
+    account_data = ib.account_summary.get(account_id, {})
+    summary = AccountSummary(
+        account_id=account_id,
+        currency=account_data.get('Currency', 'USD'),
+        last_updated=now_iso,
+        net_liquidation=float(account_data.get('NetLiquidation', 0)) if account_data.get('NetLiquidation') else None
+    )
+
+    return AccountData(
+        account=summary,
+        positions=build_position_list(ib),
+        orders=build_order_list(ib),
+        last_updated=now_iso
+    )
+
+# Short-TTL coalescing for the polled account endpoints. Dashboards
+# polling faster than the TTL share one TWS fetch instead of stacking
+# identical work on the TWS worker; the window is short enough that
+# nobody sees stale balances
+ACCOUNT_FETCH_TTL = 0.5
+account_fetch_cache: Dict[str, tuple] = {}
+account_fetch_inflight: Dict[str, asyncio.Task] = {}
+
+async def coalesced_tws_fetch(key: str, fetch):
+    """Run a TWS fetch with TTL caching and single-flight coalescing
+
+    The first caller inside the TTL window performs the fetch on the
+    TWS worker; concurrent callers await the same in-flight task and
+    later callers reuse its result until the window expires. Only
+    touched from the event loop, so no locking is needed.
+    """
+    cached = account_fetch_cache.get(key)
+    if cached and time.monotonic() - cached[0] < ACCOUNT_FETCH_TTL:
+        return cached[1]
+
+    task = account_fetch_inflight.get(key)
+    if task is None:
+        async def run():
+            value = await run_tws_operation(fetch)
+            account_fetch_cache[key] = (time.monotonic(), value)
+            return value
+        task = asyncio.ensure_future(run())
+        account_fetch_inflight[key] = task
+        task.add_done_callback(lambda t: account_fetch_inflight.pop(key, None))
+    return await task
+
 # Account endpoints
 @app.get("/account/summary", response_model=AccountSummary)
-async def get_account_summary():
+async def get_account_summary(http_request: Request):
     """Get account summary information"""
     try:
         logger.info("Account summary endpoint called")
-        summary = await run_tws_operation(get_account_summary_sync)
-        logger.info(f"Successfully retrieved account summary for account: {summary.account_id}")
-        return summary
+        summary = await coalesced_tws_fetch('summary', get_account_summary_sync)
+        logger.info("Successfully retrieved account summary for account: %s", summary.account_id)
+        # Account data is per-user, so private with a short window that
+        # still absorbs rerender bursts
+        return cached_json_response(vars(summary), http_request, max_age=10, public=False)
         
     except HTTPException as he:
-        logger.error(f"HTTP Exception in account summary: {he.detail}")
+        logger.error("HTTP Exception in account summary: %s", he.detail)
         raise he
     except Exception as e:
         error_str = str(e)
-        logger.error(f"Error in account summary endpoint: {error_str}")
+        logger.error("Error in account summary endpoint: %s", error_str)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2234,20 +3088,22 @@ async def get_account_summary():
         )
 
 @app.get("/account/positions", response_model=List[Position])
-async def get_account_positions():
+async def get_account_positions(http_request: Request):
     """Get current account positions"""
     try:
         logger.info("Account positions endpoint called")
-        positions = await run_tws_operation(get_positions_sync)
-        logger.info(f"Successfully retrieved {len(positions)} positions")
-        return positions
+        positions = await coalesced_tws_fetch('positions', get_positions_sync)
+        logger.info("Successfully retrieved %s positions", len(positions))
+        # Pollers revalidate with If-None-Match and get a bodyless 304
+        # while the snapshot is unchanged
+        return cached_json_response([vars(p) for p in positions], http_request, max_age=2, public=False)
         
     except HTTPException as he:
-        logger.error(f"HTTP Exception in account positions: {he.detail}")
+        logger.error("HTTP Exception in account positions: %s", he.detail)
         raise he
     except Exception as e:
         error_str = str(e)
-        logger.error(f"Error in account positions endpoint: {error_str}")
+        logger.error("Error in account positions endpoint: %s", error_str)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2255,75 +3111,46 @@ async def get_account_positions():
         )
 
 @app.get("/account/orders", response_model=List[Order])
-async def get_account_orders():
+async def get_account_orders(http_request: Request):
     """Get current account orders"""
     try:
         logger.info("Account orders endpoint called")
-        orders = await run_tws_operation(get_orders_sync)
-        logger.info(f"Successfully retrieved {len(orders)} orders")
-        return orders
+        orders = await coalesced_tws_fetch('orders', get_orders_sync)
+        logger.info("Successfully retrieved %s orders", len(orders))
+        return cached_json_response([vars(o) for o in orders], http_request, max_age=2, public=False)
         
     except HTTPException as he:
-        logger.error(f"HTTP Exception in account orders: {he.detail}")
+        logger.error("HTTP Exception in account orders: %s", he.detail)
         raise he
     except Exception as e:
         error_str = str(e)
-        logger.error(f"Error in account orders endpoint: {error_str}")
+        logger.error("Error in account orders endpoint: %s", error_str)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get account orders: {error_str}"
         )
 
+# /snapshot is the short alias dashboards hit when they need all three
+# datasets; both routes share the overlapped single-round-trip fetch
+@app.get("/snapshot", response_model=AccountData)
 @app.get("/account/all", response_model=AccountData)
 async def get_all_account_data():
-    """Get all account data (summary, positions, orders) in one call - sequential for stability"""
+    """Get all account data (summary, positions, orders) in one call"""
     try:
-        logger.info("All account data endpoint called - using sequential approach for stability")
-        
-        # Get account summary first (most important)
-        try:
-            summary = await run_tws_operation(get_account_summary_sync)
-            logger.info(f"✅ Account summary retrieved for: {summary.account_id}")
-        except Exception as e:
-            logger.error(f"❌ Failed to get account summary: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to get account summary: {str(e)}"
-            )
-        
-        # Get positions (optional - continue if fails)
-        positions = []
-        try:
-            positions = await run_tws_operation(get_positions_sync)
-            logger.info(f"✅ Positions retrieved: {len(positions)} positions")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to get positions (continuing): {e}")
-        
-        # Get orders (optional - continue if fails)  
-        orders = []
-        try:
-            orders = await run_tws_operation(get_orders_sync)
-            logger.info(f"✅ Orders retrieved: {len(orders)} orders")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to get orders (continuing): {e}")
-        
-        account_data = AccountData(
-            account=summary,
-            positions=positions,
-            orders=orders,
-            last_updated=datetime.now().isoformat()
-        )
-        
-        logger.info(f"✅ Successfully retrieved account data for account: {summary.account_id} (summary + {len(positions)} positions + {len(orders)} orders)")
+        logger.info("All account data endpoint called - overlapping the three TWS requests")
+
+        account_data = await coalesced_tws_fetch('account_all', get_all_account_data_sync)
+
+        logger.info("✅ Successfully retrieved account data for account: %s (summary + %s positions + %s orders)", account_data.account.account_id, len(account_data.positions), len(account_data.orders))
         return account_data
         
     except HTTPException as he:
-        logger.error(f"HTTP Exception in all account data: {he.detail}")
+        logger.error("HTTP Exception in all account data: %s", he.detail)
         raise he
     except Exception as e:
         error_str = str(e)
-        logger.error(f"Error in all account data endpoint: {error_str}")
+        logger.error("Error in all account data endpoint: %s", error_str)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2355,199 +3182,205 @@ async def discover_symbols(request: SymbolDiscoveryRequest):
                 "count": len(cached_results)
             }
         
-        logger.info(f"Symbol discovery for pattern: {pattern} ({request.secType}) on {request.exchange}")
+        logger.info("Symbol discovery for pattern: %s (%s) on %s", pattern, request.secType, request.exchange)
         
-        # Get connection
-        ib = get_ib_connection()
-        if not verify_connection_health(ib):
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="IB Gateway connection is not available"
-            )
+        # Everything from here on is blocking ibapi work with multi-second
+        # waits per probe pattern, so it runs on the TWS worker thread
+        # instead of stalling the event loop for the whole discovery
+        def discover_sync():
+            # Get connection
+            ib = get_ib_connection()
+            if not verify_connection_health(ib):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="IB Gateway connection is not available"
+                )
         
-        results = []
-        method_used = "none"
+            results = []
+            method_used = "none"
         
-        # Phase 1: Try reqContractDetails first (precise filtering)
-        try:
-            logger.info(f"Phase 1: Trying reqContractDetails for {pattern}")
+            # Phase 1: Try reqContractDetails first (precise filtering)
+            try:
+                logger.info("Phase 1: Trying reqContractDetails for %s", pattern)
             
-            # Support wildcard pattern matching
-            search_patterns = []
-            if len(pattern) == 1:
-                # Single letter: try exact first, then common two-letter combinations
-                search_patterns = [
-                    pattern,  # Exact match (e.g., "A")
-                    f"{pattern}A",  # AA (American Airlines, etc.)
-                    f"{pattern}M",  # AM (American Express, AMD, etc.)
-                    f"{pattern}P",  # AP (Apple, etc.)
-                    f"{pattern}D",  # AD patterns
-                    f"{pattern}I",  # AI patterns
-                    f"{pattern}L",  # AL patterns
-                    f"{pattern}B",  # AB patterns
-                    f"{pattern}C",  # AC patterns
-                    f"{pattern}G",  # AG patterns
-                    f"{pattern}R",  # AR patterns
-                    f"{pattern}S",  # AS patterns
-                    f"{pattern}T",  # AT patterns
-                    f"{pattern}V",  # AV patterns
-                    f"{pattern}Z",  # AZ patterns
-                ]
-            elif len(pattern) >= 2:
-                # Multiple letters: try exact and wildcard
-                search_patterns = [pattern, f"{pattern}*"]
-            else:
-                search_patterns = [pattern]
+                # Support wildcard pattern matching
+                search_patterns = []
+                if len(pattern) == 1:
+                    # Single letter: try exact first, then common two-letter combinations
+                    search_patterns = [
+                        pattern,  # Exact match (e.g., "A")
+                        f"{pattern}A",  # AA (American Airlines, etc.)
+                        f"{pattern}M",  # AM (American Express, AMD, etc.)
+                        f"{pattern}P",  # AP (Apple, etc.)
+                        f"{pattern}D",  # AD patterns
+                        f"{pattern}I",  # AI patterns
+                        f"{pattern}L",  # AL patterns
+                        f"{pattern}B",  # AB patterns
+                        f"{pattern}C",  # AC patterns
+                        f"{pattern}G",  # AG patterns
+                        f"{pattern}R",  # AR patterns
+                        f"{pattern}S",  # AS patterns
+                        f"{pattern}T",  # AT patterns
+                        f"{pattern}V",  # AV patterns
+                        f"{pattern}Z",  # AZ patterns
+                    ]
+                elif len(pattern) >= 2:
+                    # Multiple letters: try exact and wildcard
+                    search_patterns = [pattern, f"{pattern}*"]
+                else:
+                    search_patterns = [pattern]
             
-            # Collect all contracts from all search patterns
-            all_contracts = []
+                # Collect all contracts from all search patterns
+                all_contracts = []
             
-            for search_pattern in search_patterns:
-                contract = create_contract(search_pattern, request.secType, request.exchange, request.currency)
+                for search_pattern in search_patterns:
+                    contract = create_contract(search_pattern, request.secType, request.exchange, request.currency)
                 
-                # Clear previous results for this specific search
-                ib.contracts = []
+                    # Clear previous results for this specific search
+                    ib.contracts = []
                 
-                # Request contract details
-                ib.reqContractDetails(10, contract)
-                time.sleep(2)  # Wait for results
+                    # Request contract details
+                    ib.reqContractDetails(10, contract)
+                    time.sleep(2)  # Wait for results
                 
-                logger.info(f"Found {len(ib.contracts)} contracts for pattern: {search_pattern}")
+                    logger.info("Found %s contracts for pattern: %s", len(ib.contracts), search_pattern)
                 
-                # Collect all contracts from this search
-                if ib.contracts:
-                    all_contracts.extend(ib.contracts)
+                    # Collect all contracts from this search
+                    if ib.contracts:
+                        all_contracts.extend(ib.contracts)
                 
-                # Stop early if we have lots of contracts already
-                if len(all_contracts) >= request.max_results * 2:  # Get extra to allow for filtering
-                    logger.info(f"Early stop: collected {len(all_contracts)} contracts")
-                    break
+                    # Stop early if we have lots of contracts already
+                    if len(all_contracts) >= request.max_results * 2:  # Get extra to allow for filtering
+                        logger.info("Early stop: collected %s contracts", len(all_contracts))
+                        break
             
-            # Now process all collected contracts
-            logger.info(f"Processing {len(all_contracts)} total contracts from all search patterns")
+                # Now process all collected contracts
+                logger.info("Processing %s total contracts from all search patterns", len(all_contracts))
             
-            for contract in all_contracts:
-                # Filter results to match the original pattern (case-insensitive)
-                if pattern.lower() in contract.symbol.lower():
-                    # Extract company name (consistent with existing endpoint)
-                    company_name = getattr(contract, 'longName', '') or contract.symbol
+                for contract in all_contracts:
+                    # Filter results to match the original pattern (case-insensitive)
+                    if pattern.lower() in contract.symbol.lower():
+                        # Extract company name (consistent with existing endpoint)
+                        company_name = getattr(contract, 'longName', '') or contract.symbol
                     
-                    result = {
-                        "symbol": contract.symbol,
-                        "company_name": company_name,
-                        "description": f"{contract.symbol} - {company_name}",
-                        "secType": contract.secType,
-                        "exchange": contract.exchange,
-                        "currency": contract.currency,
-                        "conid": str(getattr(contract, 'conId', '')),
-                        "primary_exchange": getattr(contract, 'primaryExchange', ''),
-                        "local_symbol": getattr(contract, 'localSymbol', ''),
-                        "trading_class": getattr(contract, 'tradingClass', ''),
-                        "method": "reqContractDetails"
-                    }
+                        result = {
+                            "symbol": contract.symbol,
+                            "company_name": company_name,
+                            "description": f"{contract.symbol} - {company_name}",
+                            "secType": contract.secType,
+                            "exchange": contract.exchange,
+                            "currency": contract.currency,
+                            "conid": str(getattr(contract, 'conId', '')),
+                            "primary_exchange": getattr(contract, 'primaryExchange', ''),
+                            "local_symbol": getattr(contract, 'localSymbol', ''),
+                            "trading_class": getattr(contract, 'tradingClass', ''),
+                            "method": "reqContractDetails"
+                        }
                     
-                    # Avoid duplicates by symbol
-                    if not any(r['symbol'] == result['symbol'] for r in results):
-                        results.append(result)
-                        logger.info(f"Added to results: {contract.symbol} ({contract.secType}) on {contract.exchange}")
+                        # Avoid duplicates by symbol
+                        if not any(r['symbol'] == result['symbol'] for r in results):
+                            results.append(result)
+                            logger.info("Added to results: %s (%s) on %s", contract.symbol, contract.secType, contract.exchange)
                     
-                    # Stop if we have enough results
-                    if len(results) >= request.max_results:
-                        break
+                        # Stop if we have enough results
+                        if len(results) >= request.max_results:
+                            break
             
-            if results:
-                method_used = "reqContractDetails"
-                logger.info(f"Phase 1 success: Found {len(results)} symbols using reqContractDetails")
-            else:
-                logger.info(f"Phase 1: No results found for pattern {pattern} using reqContractDetails")
+                if results:
+                    method_used = "reqContractDetails"
+                    logger.info("Phase 1 success: Found %s symbols using reqContractDetails", len(results))
+                else:
+                    logger.info("Phase 1: No results found for pattern %s using reqContractDetails", pattern)
             
-        except Exception as e:
-            logger.error(f"Phase 1 (reqContractDetails) failed: {e}", exc_info=True)
+            except Exception as e:
+                logger.error("Phase 1 (reqContractDetails) failed: %s", e, exc_info=True)
         
-        # Phase 2: Fallback to reqMatchingSymbols if needed and enabled
-        if len(results) < 5 and request.use_fallback:  # Use fallback if we have fewer than 5 results
-            try:
-                logger.info(f"Phase 2: Trying reqMatchingSymbols for {pattern}")
+            # Phase 2: Fallback to reqMatchingSymbols if needed and enabled
+            if len(results) < 5 and request.use_fallback:  # Use fallback if we have fewer than 5 results
+                try:
+                    logger.info("Phase 2: Trying reqMatchingSymbols for %s", pattern)
                 
-                # Clear any previous data
-                if hasattr(ib, 'symbols'):
-                    ib.symbols = []
-                else:
-                    ib.symbols = []
+                    # Clear any previous data
+                    if hasattr(ib, 'symbols'):
+                        ib.symbols = []
+                    else:
+                        ib.symbols = []
                 
-                # Request matching symbols - try both exact and expanded patterns
-                search_term = pattern
-                if len(pattern) == 1:
-                    # For single characters, search for common combinations
-                    search_term = pattern  # Start with exact character
+                    # Request matching symbols - try both exact and expanded patterns
+                    search_term = pattern
+                    if len(pattern) == 1:
+                        # For single characters, search for common combinations
+                        search_term = pattern  # Start with exact character
                 
-                ib.reqMatchingSymbols(11, search_term)
-                time.sleep(3)  # Wait longer for matching symbols
+                    ib.reqMatchingSymbols(11, search_term)
+                    time.sleep(3)  # Wait longer for matching symbols
                 
-                logger.info(f"Phase 2: reqMatchingSymbols returned {len(getattr(ib, 'symbols', []))} symbols")
+                    logger.info("Phase 2: reqMatchingSymbols returned %s symbols", len(getattr(ib, 'symbols', [])))
                 
-                if hasattr(ib, 'symbols') and ib.symbols:
-                    for contract_desc in ib.symbols:
-                        contract_obj = contract_desc.contract
+                    if hasattr(ib, 'symbols') and ib.symbols:
+                        for contract_desc in ib.symbols:
+                            contract_obj = contract_desc.contract
                         
-                        # Filter by security type and exchange if specified
-                        if (contract_obj.secType == request.secType and 
-                            (request.exchange == 'SMART' or contract_obj.exchange == request.exchange) and
-                            contract_obj.currency == request.currency):
+                            # Filter by security type and exchange if specified
+                            if (contract_obj.secType == request.secType and 
+                                (request.exchange == 'SMART' or contract_obj.exchange == request.exchange) and
+                                contract_obj.currency == request.currency):
                             
-                            result = {
-                                "symbol": contract_obj.symbol,
-                                "company_name": getattr(contract_desc, 'derivativeSecTypes', [contract_obj.symbol])[0] if hasattr(contract_desc, 'derivativeSecTypes') else contract_obj.symbol,
-                                "description": f"{contract_obj.symbol} - {getattr(contract_desc, 'derivativeSecTypes', ['N/A'])[0] if hasattr(contract_desc, 'derivativeSecTypes') else 'N/A'}",
-                                "secType": contract_obj.secType,
-                                "exchange": contract_obj.exchange,
-                                "currency": contract_obj.currency,
-                                "conid": getattr(contract_obj, 'conId', ''),
-                                "primary_exchange": getattr(contract_obj, 'primaryExchange', ''),
-                                "local_symbol": getattr(contract_obj, 'localSymbol', ''),
-                                "trading_class": getattr(contract_obj, 'tradingClass', ''),
-                                "method": "reqMatchingSymbols"
-                            }
+                                result = {
+                                    "symbol": contract_obj.symbol,
+                                    "company_name": getattr(contract_desc, 'derivativeSecTypes', [contract_obj.symbol])[0] if hasattr(contract_desc, 'derivativeSecTypes') else contract_obj.symbol,
+                                    "description": f"{contract_obj.symbol} - {getattr(contract_desc, 'derivativeSecTypes', ['N/A'])[0] if hasattr(contract_desc, 'derivativeSecTypes') else 'N/A'}",
+                                    "secType": contract_obj.secType,
+                                    "exchange": contract_obj.exchange,
+                                    "currency": contract_obj.currency,
+                                    "conid": getattr(contract_obj, 'conId', ''),
+                                    "primary_exchange": getattr(contract_obj, 'primaryExchange', ''),
+                                    "local_symbol": getattr(contract_obj, 'localSymbol', ''),
+                                    "trading_class": getattr(contract_obj, 'tradingClass', ''),
+                                    "method": "reqMatchingSymbols"
+                                }
                             
-                            # Avoid duplicates
-                            if not any(r['symbol'] == result['symbol'] for r in results):
-                                results.append(result)
+                                # Avoid duplicates
+                                if not any(r['symbol'] == result['symbol'] for r in results):
+                                    results.append(result)
                 
-                if results:
-                    method_used = "reqMatchingSymbols"
-                    logger.info(f"Phase 2 success: Found {len(results)} symbols using reqMatchingSymbols")
+                    if results:
+                        method_used = "reqMatchingSymbols"
+                        logger.info("Phase 2 success: Found %s symbols using reqMatchingSymbols", len(results))
                 
-            except Exception as e:
-                logger.warning(f"Phase 2 (reqMatchingSymbols) failed: {e}")
+                except Exception as e:
+                    logger.warning("Phase 2 (reqMatchingSymbols) failed: %s", e)
         
-        # Sort results by symbol name for consistency
-        results.sort(key=lambda x: x['symbol'])
+            # Sort results by symbol name for consistency
+            results.sort(key=lambda x: x['symbol'])
         
-        # Limit results
-        limited_results = results[:request.max_results]
+            # Limit results
+            limited_results = results[:request.max_results]
         
-        # Phase 3: Cache the results
-        if limited_results:
-            cache_symbols(cache_key, limited_results)
+            # Phase 3: Cache the results
+            if limited_results:
+                cache_symbols(cache_key, limited_results)
         
-        logger.info(f"Symbol discovery completed: {len(limited_results)} results using {method_used}")
-        if limited_results:
-            symbols_found = [r['symbol'] for r in limited_results]
-            logger.info(f"Symbols found: {symbols_found}")
+            logger.info("Symbol discovery completed: %s results using %s", len(limited_results), method_used)
+            if limited_results:
+                symbols_found = [r['symbol'] for r in limited_results]
+                logger.info("Symbols found: %s", symbols_found)
         
-        return {
-            "results": limited_results,
-            "method": method_used,
-            "cached": False,
-            "count": len(limited_results),
-            "pattern": pattern,
-            "secType": request.secType,
-            "exchange": request.exchange,
-            "currency": request.currency
-        }
+            return {
+                "results": limited_results,
+                "method": method_used,
+                "cached": False,
+                "count": len(limited_results),
+                "pattern": pattern,
+                "secType": request.secType,
+                "exchange": request.exchange,
+                "currency": request.currency
+            }
+
+        return await run_tws_operation(discover_sync)
         
     except Exception as e:
-        logger.error(f"Error in symbol discovery: {e}")
+        logger.error("Error in symbol discovery: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Symbol discovery failed: {str(e)}"
@@ -2575,14 +3408,32 @@ async def clear_cache():
     global symbol_cache
     cache_size = len(symbol_cache)
     symbol_cache = {}
-    logger.info(f"Symbol cache cleared. Removed {cache_size} entries.")
+    logger.info("Symbol cache cleared. Removed %s entries.", cache_size)
     return {"message": f"Cache cleared. Removed {cache_size} entries."}
 
 if __name__ == "__main__":
+    # Only the launcher needs uvicorn; importing it at module top would
+    # tax every worker/import of main (e.g. test collection, tooling)
+    import uvicorn
+
     logger.info("Starting TWS API Service...")
+    # uvloop + httptools (bundled with uvicorn[standard]) replace the
+    # pure-Python event loop and HTTP parser with C implementations.
+    # Multi-worker runs need the import-string form and give each
+    # process its own IB connection, so every worker must be assigned a
+    # distinct IB_CLIENT_ID range by the supervisor
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     uvicorn.run(
-        app,
+        "main:app" if workers > 1 else app,
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        # Hold HTTP/1.1 connections open between polls: the front-end hits
+        # the realtime/account endpoints every couple of seconds, and
+        # keepalive spares it a TCP handshake per poll. uvicorn already
+        # sets TCP_NODELAY on accepted sockets
+        timeout_keep_alive=30,
+        workers=workers if workers > 1 else None
     ) 
\ No newline at end of file